@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import logging
-import os
 import shutil
 from datetime import timedelta
 from pathlib import Path
@@ -11,11 +10,9 @@ from homeassistant.components import websocket_api
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.event import async_track_time_interval
 
 from .const import (
-    CONF_LOCK_NODE_ID,
     DEFAULT_SCHEDULE_CHECK_INTERVAL_MINUTES,
     DOMAIN,
     OPTION_SCHEDULE_CHECK_INTERVAL_MINUTES,
@@ -147,8 +144,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        # Remove coordinator
-        hass.data[DOMAIN].pop(entry.entry_id)
+        # Remove coordinator, writing out any delayed user data save
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_flush_user_data()
 
         # Remove services if no more instances
         if not hass.data[DOMAIN]:
@@ -162,6 +160,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 "pull_codes_from_lock",
                 "enable_user",
                 "disable_user",
+                "set_volume_all",
             ]:
                 hass.services.async_remove(DOMAIN, service)
 
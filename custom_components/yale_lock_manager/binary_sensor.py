@@ -12,7 +12,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_LOCK_NAME, DOMAIN
+from .const import DOMAIN
 from .coordinator import YaleLockCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -49,13 +49,7 @@ class YaleLockDoorSensor(CoordinatorEntity, BinarySensorEntity):
         super().__init__(coordinator)
         self._attr_unique_id = f"{entry.entry_id}_door"
         self._attr_name = "Door"
-        lock_name = entry.data.get(CONF_LOCK_NAME, "Yale Lock")
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": f"{lock_name} Manager",
-            "manufacturer": "Yale Lock Manager",
-            "model": "Lock Code Manager",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def is_on(self) -> bool | None:
@@ -86,13 +80,7 @@ class YaleLockBoltSensor(CoordinatorEntity, BinarySensorEntity):
         super().__init__(coordinator)
         self._attr_unique_id = f"{entry.entry_id}_bolt"
         self._attr_name = "Bolt"
-        lock_name = entry.data.get(CONF_LOCK_NAME, "Yale Lock")
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": f"{lock_name} Manager",
-            "manufacturer": "Yale Lock Manager",
-            "model": "Lock Code Manager",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def is_on(self) -> bool | None:
@@ -2,7 +2,7 @@
 from typing import Final
 
 DOMAIN: Final = "yale_lock_manager"
-VERSION: Final = "1.8.4.55"
+VERSION: Final = "1.8.4.135"
 
 # Z-Wave JS Domain
 ZWAVE_JS_DOMAIN: Final = "zwave_js"
@@ -15,6 +15,7 @@ CONF_LOCK_NAME: Final = "lock_name"
 # Storage
 STORAGE_KEY: Final = f"{DOMAIN}.users"
 STORAGE_VERSION: Final = 1
+STORAGE_SAVE_DELAY: Final = 10  # Seconds; consecutive user data changes collapse into one disk write
 
 # Z-Wave Command Classes
 CC_DOOR_LOCK: Final = 98
@@ -93,9 +94,17 @@ SERVICE_SET_NOTIFICATION_ENABLED: Final = "set_notification_enabled"
 SERVICE_SEND_TEST_NOTIFICATION: Final = "send_test_notification"
 SERVICE_GET_NOTIFICATION_SERVICES: Final = "get_notification_services"
 SERVICE_IMPORT_USER_DATA: Final = "import_user_data"
+SERVICE_SET_VOLUME_ALL: Final = "set_volume_all"
 
 # Defaults
 DEFAULT_SCAN_INTERVAL: Final = 300  # 5 minutes
+REQUEST_REFRESH_COOLDOWN: Final = 0.5  # Seconds; bursts of refresh requests collapse into one
+CONFIG_WRITE_BATCH_WINDOW: Final = 0.05  # Seconds; config writes queued within this window go out together
+USER_CODE_QUERY_TIMEOUT: Final = 10  # Seconds; wait for the lock to answer a user code query
+USER_CODE_QUERY_CONCURRENCY: Final = 5  # User code queries in flight at once during a full pull
+USER_CODE_CACHE_TTL: Final = 2.0  # Seconds; repeat queries for a slot within this reuse the last answer
+SCHEDULE_PUSH_CONCURRENCY: Final = 3  # Slots pushed/cleared at once when schedules start or end
+ACCESS_STATE_WRITE_DELAY: Final = 0.1  # Seconds; access bursts collapse into one sensor state write
 MIN_CODE_LENGTH: Final = 4
 MAX_CODE_LENGTH: Final = 8
 MAX_USER_SLOTS: Final = 20
@@ -120,3 +129,7 @@ ATTR_SYNCED: Final = "synced_to_lock"
 ATTR_LAST_USED: Final = "last_used"
 ATTR_NOTIFICATION_SERVICE: Final = "notification_service"  # Deprecated, use ATTR_NOTIFICATION_SERVICES
 ATTR_NOTIFICATION_SERVICES: Final = "notification_services"
+ATTR_VOLUME: Final = "volume"
+
+# Volume option -> config parameter 1 value
+VOLUME_OPTIONS: Final = {"Silent": 1, "Low": 2, "High": 3}
@@ -2,37 +2,40 @@
 from __future__ import annotations
 
 import asyncio
-import time
-from datetime import datetime, timedelta
+import logging
+from datetime import datetime, timedelta, timezone
+from collections.abc import Awaitable, Callable, Hashable, Iterator, Mapping
+from functools import cached_property, lru_cache
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from .lock import YaleLockManagerLock
 
 from homeassistant.components.zwave_js import DOMAIN as ZWAVE_JS_DOMAIN
-from homeassistant.config_entries import ConfigEntry, ConfigEntryState
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import ATTR_DOMAIN, EVENT_SERVICE_REGISTERED, EVENT_SERVICE_REMOVED
+from homeassistant.core import Context, Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.json import json_dumps
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 from .const import (
     ACCESS_METHOD_AUTO,
-    ACCESS_METHOD_MANUAL,
     ACCESS_METHOD_PIN,
-    ALARM_TYPE_AUTO_LOCK,
-    ALARM_TYPE_KEYPAD_UNLOCK,
-    ALARM_TYPE_RF_LOCK,
-    ALARM_TYPE_RF_UNLOCK,
     CC_BATTERY,
     CC_NOTIFICATION,
-    CC_BATTERY,
-    CC_DOOR_LOCK,
-    CC_NOTIFICATION,
     CODE_TYPE_FOB,
     CODE_TYPE_PIN,
     CONF_LOCK_ENTITY_ID,
+    CONF_LOCK_NAME,
+    CONFIG_WRITE_BATCH_WINDOW,
     CONF_LOCK_NODE_ID,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
@@ -45,18 +48,70 @@ from .const import (
     EVENT_UNLOCKED,
     EVENT_USAGE_LIMIT_REACHED,
     MAX_USER_SLOTS,
+    REQUEST_REFRESH_COOLDOWN,
+    SCHEDULE_PUSH_CONCURRENCY,
     USER_STATUS_AVAILABLE,
     USER_STATUS_DISABLED,
     USER_STATUS_ENABLED,
+    VERSION,
 )
 from .logger import YaleLockLogger
 from .storage import UserDataStorage
-from .sync_manager import SyncManager
+from .sync_manager import SyncManager, compute_synced
 from .zwave_client import ZWaveClient
 
 _LOGGER = YaleLockLogger()
 
 
+def _mask(code: str | None) -> str:
+    """Return a log-safe placeholder for a PIN."""
+    return "***" if code else "None"
+
+
+@lru_cache(maxsize=256)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp.
+
+    Memoized: the same stored schedule strings are re-parsed on every
+    validity check. Naive values are left to the caller, which applies the
+    local timezone.
+    """
+    return datetime.fromisoformat(value)
+
+
+@lru_cache(maxsize=256)
+def _parse_last_used(value: str) -> datetime:
+    """Parse a stored last_used timestamp as an aware UTC datetime.
+
+    Everything this integration writes is already UTC-aware; the fix-up only
+    applies to naive strings from older data or imported backups, and is
+    cached with the parse so it runs once per string.
+    """
+    dt = datetime.fromisoformat(value)
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=timezone.utc)
+
+
+@callback
+def _is_notify_service_event(event_data: Mapping[str, Any]) -> bool:
+    """Return True for service registered/removed events of the notify domain."""
+    return event_data.get(ATTR_DOMAIN) == "notify"
+
+
+def _iter_parsed_accesses(
+    users: Mapping[int, Any],
+) -> Iterator[tuple[datetime, str | None]]:
+    """Yield (last_used, name) for every user with a parseable last_used."""
+    for user_data in users.values():
+        last_used = user_data.get("last_used")
+        if not last_used:
+            continue
+        try:
+            dt = _parse_last_used(last_used)
+        except (ValueError, TypeError):
+            continue
+        yield dt, user_data.get("name")
+
+
 class YaleLockCoordinator(DataUpdateCoordinator):
     """Coordinator to manage Yale lock data."""
 
@@ -65,6 +120,14 @@ class YaleLockCoordinator(DataUpdateCoordinator):
         self.entry = entry
         self.node_id = entry.data[CONF_LOCK_NODE_ID]
         self.lock_entity_id = entry.data[CONF_LOCK_ENTITY_ID]
+        self.lock_name = entry.data.get(CONF_LOCK_NAME, "Yale Lock")
+
+        # Device identifiers shared by every entity of this entry
+        self.device_identifiers = frozenset({(DOMAIN, entry.entry_id)})
+
+        # Method of the last access on this lock, pushed to entities via access_signal
+        self.last_access_method: str | None = None
+        self.access_signal = f"{EVENT_ACCESS}_{entry.entry_id}"
         
         # Log node_id at initialization for debugging
         _LOGGER.info("Coordinator initialized - node_id from config: %s (type: %s), lock_entity_id: %s", 
@@ -86,11 +149,39 @@ class YaleLockCoordinator(DataUpdateCoordinator):
         # Reference to lock entity for state updates
         self._lock_entity: YaleLockManagerLock | None = None
 
+        # Bumped whenever user data is loaded or saved (see users_version)
+        self._users_version = 0
+
+        # Most recent (last_used, user name), recomputed when users_version changes
+        self._recent_access: tuple[datetime | None, str | None] = (None, None)
+        self._recent_access_version = -1
+
+        # In-flight operations per key: (target, task); joined only by calls
+        # for the same target
+        self._inflight: dict[Hashable, tuple[Hashable, asyncio.Task]] = {}
+
+        # Config parameter writes waiting for the next batch flush
+        self._pending_config: dict[int, int] = {}
+        self._config_flush: asyncio.Task | None = None
+
+        # Notify services list for the UI; rebuilt after notify services change
+        self._notification_services: list[dict[str, Any]] | None = None
+
         super().__init__(
             hass,
             _LOGGER._logger,  # Use underlying logger for coordinator base class
             name=DOMAIN,
             update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            # Collapse bursts of async_request_refresh() (lock/unlock, config
+            # changes, Z-Wave value updates) into a single refresh. With
+            # immediate=False the call only arms the debounce timer, so
+            # awaiting it never blocks a service call on the refresh itself
+            request_refresh_debouncer=Debouncer(
+                hass,
+                _LOGGER._logger,
+                cooldown=REQUEST_REFRESH_COOLDOWN,
+                immediate=False,
+            ),
         )
 
         # Listen to Z-Wave JS events
@@ -101,25 +192,143 @@ class YaleLockCoordinator(DataUpdateCoordinator):
         self._lock_entity = entity
         self._logger.debug("Lock entity registered with coordinator", force=True)
     
+    async def async_run_single_flight(
+        self, key: Hashable, target: Hashable, job: Callable[[], Awaitable[None]]
+    ) -> None:
+        """Run job, or join the job already in flight for key if it has the same target.
+
+        key names what is being changed (e.g. the lock state) and target the
+        value it is being set to. Concurrent callers with the same target
+        (e.g. two automations locking at once) share one Z-Wave command. A
+        call for a different target always sends its own command and
+        replaces the in-flight entry, so lock -> unlock -> lock sends the
+        final lock instead of joining the stale first one.
+        """
+        inflight = self._inflight.get(key)
+        if inflight is not None and inflight[0] == target:
+            task = inflight[1]
+        else:
+            task = self.hass.async_create_task(job())
+            self._inflight[key] = (target, task)
+
+            def _done(_: asyncio.Task) -> None:
+                # Only clear the entry if a newer call has not replaced it
+                if self._inflight.get(key, (None, None))[1] is task:
+                    del self._inflight[key]
+
+            task.add_done_callback(_done)
+        # Shield so one caller being cancelled does not cancel the shared call
+        await asyncio.shield(task)
+
+    async def async_set_locked(self, locked: bool, context: Context | None = None) -> None:
+        """Lock or unlock the underlying Z-Wave lock."""
+        await self._zwave_client.set_locked(locked, context)
+
+    async def async_set_config_parameter(self, parameter: int, value: int) -> None:
+        """Write a lock config parameter, batched with other writes queued at the same time.
+
+        Writes requested within CONFIG_WRITE_BATCH_WINDOW (e.g. both relock
+        times saved together) are sent concurrently in one flush instead of
+        one after another. Raises if this parameter's write failed.
+        """
+        self._pending_config[parameter] = value
+        if self._config_flush is None:
+            self._config_flush = self.hass.async_create_task(self._async_flush_config())
+        results = await asyncio.shield(self._config_flush)
+        if (err := results.get(parameter)) is not None:
+            raise err
+
+    async def async_set_volume(self, value: int) -> None:
+        """Write the lock volume (config parameter 1) and update entity state.
+
+        The write is authoritative, so entities are updated without re-polling
+        the lock.
+        """
+        await self.async_set_config_parameter(1, value)
+        if self.data:
+            self.data["volume"] = value
+        self.async_update_listeners()
+
+    async def async_set_auto_relock(self, enabled: bool) -> None:
+        """Write auto relock (config parameter 2) and update entity state.
+
+        As with volume, entities are updated without re-polling the lock; the
+        regular poll reconciles any drift.
+        """
+        value = 255 if enabled else 0
+        await self.async_set_config_parameter(2, value)
+        if self.data:
+            self.data["auto_relock"] = value
+        self.async_update_listeners()
+
+    async def _async_flush_config(self) -> dict[int, BaseException | None]:
+        """Send all pending config parameter writes; return per-parameter errors."""
+        await asyncio.sleep(CONFIG_WRITE_BATCH_WINDOW)
+        pending, self._pending_config = self._pending_config, {}
+        self._config_flush = None
+        results = await asyncio.gather(
+            *(
+                self.hass.services.async_call(
+                    ZWAVE_JS_DOMAIN,
+                    "set_config_parameter",
+                    {
+                        "entity_id": self.lock_entity_id,
+                        "parameter": parameter,
+                        "value": value,
+                    },
+                    blocking=True,
+                )
+                for parameter, value in pending.items()
+            ),
+            return_exceptions=True,
+        )
+        return {
+            parameter: result if isinstance(result, BaseException) else None
+            for parameter, result in zip(pending, results)
+        }
+
     @property
     def _user_data(self) -> dict[str, Any]:
         """Backward compatibility property for _user_data."""
         return self._storage.data
 
     def _setup_listeners(self) -> None:
-        """Set up event listeners."""
+        """Set up event listeners.
+
+        All are removed when the config entry unloads, so a reload does not
+        leave the old coordinator handling every Z-Wave event a second time.
+        """
         # Listen for Z-Wave JS value updates
-        self.hass.bus.async_listen(
-            "zwave_js_value_updated",
-            self._handle_value_updated,
+        self.entry.async_on_unload(
+            self.hass.bus.async_listen(
+                "zwave_js_value_updated",
+                self._handle_value_updated,
+            )
         )
 
         # Listen for Z-Wave JS notification events
-        self.hass.bus.async_listen(
-            "zwave_js_notification",
-            self._handle_notification,
+        self.entry.async_on_unload(
+            self.hass.bus.async_listen(
+                "zwave_js_notification",
+                self._handle_notification,
+            )
         )
 
+        # Drop the cached notify services list when notify services change
+        for event_type in (EVENT_SERVICE_REGISTERED, EVENT_SERVICE_REMOVED):
+            self.entry.async_on_unload(
+                self.hass.bus.async_listen(
+                    event_type,
+                    self._invalidate_notification_services,
+                    event_filter=_is_notify_service_event,
+                )
+            )
+
+    @callback
+    def _invalidate_notification_services(self, event: Event) -> None:
+        """Forget the cached notify services list."""
+        self._notification_services = None
+
     @callback
     async def _handle_value_updated(self, event) -> None:
         """Handle Z-Wave JS value update events."""
@@ -216,18 +425,19 @@ class YaleLockCoordinator(DataUpdateCoordinator):
                 
                 if event_type == "battery low" or "battery low" in str(event_type).lower():
                     _LOGGER.warning("Battery low alarm detected for lock (urgency: %s)", urgency)
+                    now_iso = dt_util.utcnow().isoformat()
                     # Fire battery low event
                     self._fire_event(
                         f"{DOMAIN}_battery_low",
                         {
                             "entity_id": self.lock_entity_id,
                             "urgency": urgency,
-                            "timestamp": dt_util.utcnow().isoformat(),
+                            "timestamp": now_iso,
                         },
                     )
                     # Update coordinator data to reflect battery alarm
                     self.data["battery_low_alarm"] = True
-                    self.data["battery_low_timestamp"] = dt_util.utcnow().isoformat()
+                    self.data["battery_low_timestamp"] = now_iso
                     self.async_update_listeners()
                     if self._lock_entity:
                         self.hass.loop.call_later(0.2, self._lock_entity.async_write_ha_state)
@@ -277,7 +487,7 @@ class YaleLockCoordinator(DataUpdateCoordinator):
         """Handle a user access event."""
         _LOGGER.info("Access event received - Slot: %s, Method: %s", user_slot, method)
         
-        user_data = self._user_data["users"].get(str(user_slot))
+        user_data = self._user_data["users"].get(user_slot)
 
         if not user_data:
             _LOGGER.warning(
@@ -286,6 +496,7 @@ class YaleLockCoordinator(DataUpdateCoordinator):
                 list(self._user_data["users"].keys())
             )
             # Fire event even for unknown users so it appears in activity log
+            self._record_access_method(method)
             self._fire_event(
                 EVENT_ACCESS,
                 {
@@ -319,10 +530,14 @@ class YaleLockCoordinator(DataUpdateCoordinator):
             )
             return
 
+        # Single timestamp for this access (usage, coordinator data, events, notifications)
+        now = dt_util.utcnow()
+        now_iso = now.isoformat()
+
         # Update usage count
         usage_count = user_data.get("usage_count", 0) + 1
         user_data["usage_count"] = usage_count
-        user_data["last_used"] = dt_util.utcnow().isoformat()
+        user_data["last_used"] = now_iso
 
         # Check usage limit
         max_uses = user_data.get("usage_limit")
@@ -365,11 +580,16 @@ class YaleLockCoordinator(DataUpdateCoordinator):
         # Update coordinator data for entity state
         self.data["last_access_user"] = user_name
         self.data["last_access_method"] = method
-        self.data["last_access_timestamp"] = dt_util.utcnow().isoformat()
-        self.data["last_user_update"] = dt_util.utcnow().isoformat()
+        self.data["last_access_timestamp"] = now_iso
+        self.data["last_user_update"] = now_iso
 
         # Save updated data
         await self.async_save_user_data()
+
+        # This access is now the most recent one; seed recent_access with the
+        # datetime we already have instead of rescanning and parsing last_used
+        self._recent_access = (now, user_data.get("name"))
+        self._recent_access_version = self._users_version
         
         # Update entity state so UI reflects new usage count
         self.async_update_listeners()
@@ -380,6 +600,7 @@ class YaleLockCoordinator(DataUpdateCoordinator):
                      user_name, user_slot, usage_count)
 
         # Fire access event
+        self._record_access_method(method)
         self._fire_event(
             EVENT_ACCESS,
             {
@@ -387,7 +608,7 @@ class YaleLockCoordinator(DataUpdateCoordinator):
                 "user_name": user_name,
                 "user_slot": user_slot,
                 "method": method,
-                "timestamp": dt_util.utcnow().isoformat(),
+                "timestamp": now_iso,
                 "usage_count": usage_count,
             },
         )
@@ -430,7 +651,7 @@ class YaleLockCoordinator(DataUpdateCoordinator):
                     "user_name": user_name,
                     "user_slot": user_slot,
                     "method": method,
-                    "timestamp": dt_util.utcnow().isoformat(),
+                    "timestamp": now_iso,
                     "usage_count": usage_count,
                 },
             }
@@ -504,7 +725,17 @@ class YaleLockCoordinator(DataUpdateCoordinator):
         return out
 
     def get_notification_services_list(self) -> list[dict[str, Any]]:
-        """Return list of notify services for the UI (id, name, type: ui|all|device). Same source as _resolve_notification_services."""
+        """Return list of notify services for the UI (id, name, type: ui|all|device). Same source as _resolve_notification_services.
+
+        Cached until a notify service is registered or removed; callers must
+        not modify the returned list.
+        """
+        if self._notification_services is None:
+            self._notification_services = self._build_notification_services_list()
+        return self._notification_services
+
+    def _build_notification_services_list(self) -> list[dict[str, Any]]:
+        """Build the notify services list for the UI."""
         result: list[dict[str, Any]] = []
         try:
             notify_services = self.hass.services.async_services().get("notify", {})
@@ -530,7 +761,7 @@ class YaleLockCoordinator(DataUpdateCoordinator):
 
     async def async_send_test_notification(self, slot: int) -> None:
         """Send a test notification using the same path as access events (for testing)."""
-        user_data = self._user_data["users"].get(str(slot))
+        user_data = self._user_data["users"].get(slot)
         if not user_data:
             raise ValueError(f"User slot {slot} not found")
 
@@ -587,7 +818,7 @@ class YaleLockCoordinator(DataUpdateCoordinator):
 
     def _is_code_valid(self, user_slot: int) -> bool:
         """Check if a user code is currently valid based on schedule."""
-        user_data = self._user_data["users"].get(str(user_slot))
+        user_data = self._user_data["users"].get(user_slot)
         if not user_data:
             return False
 
@@ -602,14 +833,14 @@ class YaleLockCoordinator(DataUpdateCoordinator):
         now = dt_util.now()
 
         if start:
-            start_dt = datetime.fromisoformat(start)
+            start_dt = _parse_iso(start)
             if start_dt.tzinfo is None:
                 start_dt = start_dt.replace(tzinfo=now.tzinfo)
             if now < start_dt:
                 return False
 
         if end:
-            end_dt = datetime.fromisoformat(end)
+            end_dt = _parse_iso(end)
             if end_dt.tzinfo is None:
                 end_dt = end_dt.replace(tzinfo=now.tzinfo)
             if now > end_dt:
@@ -617,6 +848,12 @@ class YaleLockCoordinator(DataUpdateCoordinator):
 
         return True
 
+    @callback
+    def _record_access_method(self, method: str) -> None:
+        """Store the last access method and notify this entry's entities."""
+        self.last_access_method = method
+        async_dispatcher_send(self.hass, self.access_signal)
+
     def _fire_event(self, event_type: str, data: dict[str, Any]) -> None:
         """Fire a Home Assistant event."""
         self.hass.bus.async_fire(event_type, data)
@@ -629,11 +866,11 @@ class YaleLockCoordinator(DataUpdateCoordinator):
             data = {}
 
             # Get lock state using Z-Wave client
-            lock_state_data = await self._zwave_client.get_lock_state()
+            lock_state_data = self._zwave_client.get_lock_state()
             data.update(lock_state_data)
 
             # Get config parameters using Z-Wave client
-            config_data = await self._zwave_client.get_config_parameters()
+            config_data = self._zwave_client.get_config_parameters()
             data.update(config_data)
 
             # Get user codes status (we'll query them periodically)
@@ -796,11 +1033,9 @@ class YaleLockCoordinator(DataUpdateCoordinator):
         
         # Convert status to int for comparison
         status_int = int(status) if status is not None else USER_STATUS_AVAILABLE
-        slot_str = str(slot)
-        
         # Check if we already have this slot
-        if slot_str in self._user_data["users"]:
-            user_data = self._user_data["users"][slot_str]
+        if slot in self._user_data["users"]:
+            user_data = self._user_data["users"][slot]
             
             # Update lock state
             user_data["lock_code"] = code if code else ""
@@ -853,25 +1088,8 @@ class YaleLockCoordinator(DataUpdateCoordinator):
                 _LOGGER.warning("Slot %s: Unknown status %s", slot, status_int)
             
             # Recalculate sync status
-            cached_enabled = user_data.get("enabled", False)
-            should_be_enabled = cached_enabled and self._is_code_valid(slot)
-            lock_is_enabled = (status_int == USER_STATUS_ENABLED)
-            
-            # Synced if: code matches AND enabled state matches
             cached_code = user_data.get("code", "")
-            if should_be_enabled:
-                # Should be enabled: code must exist and match
-                user_data["synced_to_lock"] = (
-                    lock_is_enabled and
-                    cached_code == code and
-                    cached_code != ""
-                )
-            else:
-                # Should be disabled: code must NOT exist
-                user_data["synced_to_lock"] = (
-                    status_int == USER_STATUS_AVAILABLE or
-                    code == ""
-                )
+            user_data["synced_to_lock"] = self._calculate_synced(slot, user_data, code, status_int)
             
             _LOGGER.info("Slot %s updated - Cached: %s, Lock: %s, Synced: %s", 
                        slot, "***" if cached_code else "None", 
@@ -908,7 +1126,7 @@ class YaleLockCoordinator(DataUpdateCoordinator):
             raise ValueError(f"Slot must be between 1 and {MAX_USER_SLOTS}")
 
         # Get existing user data if slot exists
-        existing_user = self._user_data["users"].get(str(slot))
+        existing_user = self._user_data["users"].get(slot)
 
         # For FOBs, only save name and code_type - no code, status, schedule, or usage_limit
         if code_type == CODE_TYPE_FOB:
@@ -944,13 +1162,13 @@ class YaleLockCoordinator(DataUpdateCoordinator):
                 raise ValueError("PIN code must be at least 4 digits")
 
             # Reject duplicate PIN: same code must not be used in another slot
-            for slot_str, other in self._user_data["users"].items():
-                if int(slot_str) == slot:
+            for other_slot, other in self._user_data["users"].items():
+                if other_slot == slot:
                     continue
                 other_code = (other.get("code") or "").strip()
                 if other_code and other_code == code:
                     raise ValueError(
-                        f"Duplicate PIN: the same code is already used in slot {slot_str}. "
+                        f"Duplicate PIN: the same code is already used in slot {other_slot}. "
                         "Use a different PIN for each slot."
                     )
 
@@ -1019,7 +1237,7 @@ class YaleLockCoordinator(DataUpdateCoordinator):
             if (code_type == CODE_TYPE_PIN and lock_status == USER_STATUS_ENABLED and existing_user)
             else False
         )
-        self._user_data["users"][str(slot)] = {
+        self._user_data["users"][slot] = {
             "name": name,
             "code_type": code_type,
             "code": code,  # Cached code (editable) - empty for FOBs
@@ -1054,7 +1272,7 @@ class YaleLockCoordinator(DataUpdateCoordinator):
             return True
 
         # Check if we have this slot in our data
-        user_data = self._user_data["users"].get(str(slot))
+        user_data = self._user_data["users"].get(slot)
         if user_data:
             # We own this slot (regardless of enabled/disabled state)
             _LOGGER.debug("Slot %s found in local storage (owned by us): %s", slot, user_data.get("name"))
@@ -1069,6 +1287,26 @@ class YaleLockCoordinator(DataUpdateCoordinator):
         )
         return False
 
+    def _calculate_synced(
+        self,
+        slot: int,
+        user_data: dict[str, Any],
+        lock_code: str,
+        lock_status: int | None,
+    ) -> bool:
+        """Return whether a PIN slot's cached state matches the lock.
+
+        Same rules as SyncManager, but schedule-aware: a PIN outside its
+        schedule should be off the lock even when enabled.
+        """
+        return compute_synced(
+            CODE_TYPE_PIN,
+            user_data.get("enabled", False) and self._is_code_valid(slot),
+            user_data.get("code", ""),
+            lock_code,
+            lock_status,
+        )
+
     async def async_clear_user_code(self, slot: int, clear_local_cache: bool = False) -> None:
         """Clear a user code from storage and lock.
         
@@ -1089,10 +1327,8 @@ class YaleLockCoordinator(DataUpdateCoordinator):
             # Wait for lock to process the clear operation
             await asyncio.sleep(3.0)
             
-            slot_str = str(slot)
-            
             # If clear_local_cache is True, clear all cached fields before updating from lock
-            if clear_local_cache and slot_str in self._user_data["users"]:
+            if clear_local_cache and slot in self._user_data["users"]:
                 _LOGGER.info("Clearing all local cached details for slot %s", slot)
                 self._clear_slot_local_cache(slot)
                 _LOGGER.info("✓ All local cached details cleared for slot %s", slot)
@@ -1109,17 +1345,17 @@ class YaleLockCoordinator(DataUpdateCoordinator):
 
     async def async_enable_user(self, slot: int) -> None:
         """Enable a user code."""
-        if str(slot) in self._user_data["users"]:
-            self._user_data["users"][str(slot)]["enabled"] = True
-            self._user_data["users"][str(slot)]["synced_to_lock"] = False  # Needs push
+        if slot in self._user_data["users"]:
+            self._user_data["users"][slot]["enabled"] = True
+            self._user_data["users"][slot]["synced_to_lock"] = False  # Needs push
             await self.async_save_user_data()
             await self.async_request_refresh()
 
     async def async_disable_user(self, slot: int) -> None:
         """Disable a user code."""
-        if str(slot) in self._user_data["users"]:
-            self._user_data["users"][str(slot)]["enabled"] = False
-            self._user_data["users"][str(slot)]["synced_to_lock"] = False  # Needs push
+        if slot in self._user_data["users"]:
+            self._user_data["users"][slot]["enabled"] = False
+            self._user_data["users"][slot]["synced_to_lock"] = False  # Needs push
             await self.async_save_user_data()
             await self.async_request_refresh()
 
@@ -1131,11 +1367,10 @@ class YaleLockCoordinator(DataUpdateCoordinator):
         - DISABLED (2): Sets enabled=False (user must push to clear code from lock)
         - AVAILABLE (0): Not valid for cached status (this is what lock returns when cleared)
         """
-        slot_str = str(slot)
-        if slot_str not in self._user_data["users"]:
+        if slot not in self._user_data["users"]:
             raise ValueError(f"User slot {slot} not found")
         
-        user_data = self._user_data["users"][slot_str]
+        user_data = self._user_data["users"][slot]
         
         # Map status to enabled flag
         # Note: AVAILABLE (0) is not a settable cached status - it's what the lock returns when cleared
@@ -1161,24 +1396,12 @@ class YaleLockCoordinator(DataUpdateCoordinator):
             raise ValueError(f"Invalid status: {status}. Must be 0, 1, or 2")
         
         # Recalculate sync status based on new approach
-        cached_enabled = user_data["enabled"]
-        should_be_enabled = cached_enabled and self._is_code_valid(slot)
-        lock_status = user_data.get("lock_status_from_lock")
-        lock_code = user_data.get("lock_code", "")
-        
-        if should_be_enabled:
-            # Should be enabled: code must exist and match
-            user_data["synced_to_lock"] = (
-                lock_status == USER_STATUS_ENABLED and
-                user_data.get("code", "") == lock_code and
-                user_data.get("code", "") != ""
-            )
-        else:
-            # Should be disabled: code must NOT exist
-            user_data["synced_to_lock"] = (
-                lock_status == USER_STATUS_AVAILABLE or
-                lock_code == ""
-            )
+        user_data["synced_to_lock"] = self._calculate_synced(
+            slot,
+            user_data,
+            user_data.get("lock_code", ""),
+            user_data.get("lock_status_from_lock"),
+        )
         
         await self.async_save_user_data()
         await self.async_request_refresh()
@@ -1193,10 +1416,10 @@ class YaleLockCoordinator(DataUpdateCoordinator):
         end_datetime: str | None,
     ) -> None:
         """Set schedule for a user code."""
-        if str(slot) not in self._user_data["users"]:
+        if slot not in self._user_data["users"]:
             raise ValueError(f"User slot {slot} not found")
 
-        self._user_data["users"][str(slot)]["schedule"] = {
+        self._user_data["users"][slot]["schedule"] = {
             "start": start_datetime,
             "end": end_datetime,
         }
@@ -1205,19 +1428,19 @@ class YaleLockCoordinator(DataUpdateCoordinator):
 
     async def async_set_usage_limit(self, slot: int, max_uses: int | None) -> None:
         """Set usage limit for a user code."""
-        if str(slot) not in self._user_data["users"]:
+        if slot not in self._user_data["users"]:
             raise ValueError(f"User slot {slot} not found")
 
-        self._user_data["users"][str(slot)]["usage_limit"] = max_uses
+        self._user_data["users"][slot]["usage_limit"] = max_uses
         await self.async_save_user_data()
         await self.async_request_refresh()  # Refresh entity state so card updates
 
     async def async_reset_usage_count(self, slot: int) -> None:
         """Reset usage count for a user code back to 0."""
-        if str(slot) not in self._user_data["users"]:
+        if slot not in self._user_data["users"]:
             raise ValueError(f"User slot {slot} not found")
 
-        self._user_data["users"][str(slot)]["usage_count"] = 0
+        self._user_data["users"][slot]["usage_count"] = 0
         await self.async_save_user_data()
 
     async def async_set_notification_enabled(
@@ -1230,35 +1453,35 @@ class YaleLockCoordinator(DataUpdateCoordinator):
             enabled: Whether notifications are enabled
             notification_services: List of notification services, or single service string (for backward compatibility)
         """
-        if str(slot) not in self._user_data["users"]:
+        if slot not in self._user_data["users"]:
             raise ValueError(f"User slot {slot} not found")
 
-        self._user_data["users"][str(slot)]["notifications_enabled"] = enabled
+        self._user_data["users"][slot]["notifications_enabled"] = enabled
         
         if notification_services is not None:
             # Convert to list if single string (backward compatibility)
             if isinstance(notification_services, str):
                 notification_services = [notification_services]
-            self._user_data["users"][str(slot)]["notification_services"] = notification_services
+            self._user_data["users"][slot]["notification_services"] = notification_services
             # Remove old format if it exists
-            if "notification_service" in self._user_data["users"][str(slot)]:
-                del self._user_data["users"][str(slot)]["notification_service"]
+            if "notification_service" in self._user_data["users"][slot]:
+                del self._user_data["users"][slot]["notification_service"]
         elif enabled:
             # Set default services if enabling and no services are set
-            if "notification_services" not in self._user_data["users"][str(slot)]:
+            if "notification_services" not in self._user_data["users"][slot]:
                 # Migrate from old format if exists
-                old_service = self._user_data["users"][str(slot)].get("notification_service")
+                old_service = self._user_data["users"][slot].get("notification_service")
                 if old_service:
-                    self._user_data["users"][str(slot)]["notification_services"] = [old_service]
-                    del self._user_data["users"][str(slot)]["notification_service"]
+                    self._user_data["users"][slot]["notification_services"] = [old_service]
+                    del self._user_data["users"][slot]["notification_service"]
                 else:
-                    self._user_data["users"][str(slot)]["notification_services"] = ["notify.persistent_notification"]
+                    self._user_data["users"][slot]["notification_services"] = ["notify.persistent_notification"]
         
         await self.async_save_user_data()
         await self.async_request_refresh()  # Refresh entity state so card updates
         
         # Re-enable the user if they were disabled due to usage limit
-        user_data = self._user_data["users"][str(slot)]
+        user_data = self._user_data["users"][slot]
         if not user_data.get("enabled", False):
             await self.async_enable_user(slot)
         
@@ -1270,7 +1493,7 @@ class YaleLockCoordinator(DataUpdateCoordinator):
 
     async def async_push_code_to_lock(self, slot: int) -> None:
         """Push a code to the lock - set if enabled, clear if disabled."""
-        user_data = self._user_data["users"].get(str(slot))
+        user_data = self._user_data["users"].get(slot)
         if not user_data:
             raise ValueError(f"User slot {slot} not found")
 
@@ -1295,7 +1518,7 @@ class YaleLockCoordinator(DataUpdateCoordinator):
 
     async def _do_push_code_to_lock(self, slot: int) -> None:
         """Internal: set or clear code on lock and verify (no schedule-window check). Used by scheduler and by async_push_code_to_lock."""
-        user_data = self._user_data["users"].get(str(slot))
+        user_data = self._user_data["users"].get(slot)
         if not user_data:
             raise ValueError(f"User slot {slot} not found")
 
@@ -1404,10 +1627,9 @@ class YaleLockCoordinator(DataUpdateCoordinator):
 
     def _clear_slot_local_cache(self, slot: int) -> None:
         """Clear local cache for a slot (in-memory only; does not call the lock). Used when schedule ends or when user clears slot with clear_local_cache=True."""
-        slot_str = str(slot)
-        if slot_str not in self._user_data["users"]:
+        if slot not in self._user_data["users"]:
             return
-        user_data = self._user_data["users"][slot_str]
+        user_data = self._user_data["users"][slot]
         user_data["name"] = f"User {slot}"
         user_data["code"] = ""
         user_data["enabled"] = False
@@ -1427,9 +1649,15 @@ class YaleLockCoordinator(DataUpdateCoordinator):
         user_data["do_not_auto_enable"] = False
 
     async def async_check_schedules(self) -> None:
-        """Check all slots with schedules; push or clear codes when schedule starts or ends."""
-        for slot_str, user_data in list(self._user_data["users"].items()):
-            slot = int(slot_str)
+        """Check all slots with schedules; push or clear codes when schedule starts or ends.
+
+        Slots that need a change are pushed concurrently, at most
+        SCHEDULE_PUSH_CONCURRENCY at a time: each push waits several seconds
+        for the lock before verifying, so pushing one after another made a
+        shared schedule boundary take that long per slot.
+        """
+        changes: list[tuple[int, dict[str, Any], bool]] = []
+        for slot, user_data in self._user_data["users"].items():
             if user_data.get("code_type") == CODE_TYPE_FOB:
                 continue
             schedule = user_data.get("schedule", {})
@@ -1449,42 +1677,62 @@ class YaleLockCoordinator(DataUpdateCoordinator):
             should_be_on_lock = valid_now and (enabled or (not do_not_auto_enable and has_pin_or_name))
             if code_on_lock == should_be_on_lock:
                 continue
-            try:
-                user_name = user_data.get("name", f"User {slot}")
-                if should_be_on_lock and not enabled:
-                    user_data["enabled"] = True
-                    user_data["lock_status"] = USER_STATUS_ENABLED
-                    user_data["enabled_by_scheduler"] = True
-                await self._do_push_code_to_lock(slot)
-                if not should_be_on_lock:
-                    self._clear_slot_local_cache(slot)
-                    await self.async_save_user_data()
-                    self.data["last_user_update"] = dt_util.utcnow().isoformat()
-                    self.async_update_listeners()
-                    if self._lock_entity:
-                        self.hass.loop.call_later(0.2, self._lock_entity.async_write_ha_state)
-                event_type = EVENT_SCHEDULE_STARTED if should_be_on_lock else EVENT_SCHEDULE_ENDED
-                self._fire_event(
-                    event_type,
-                    {
-                        "entity_id": self.lock_entity_id,
-                        "slot": slot,
-                        "user_name": user_name,
-                        "timestamp": dt_util.utcnow().isoformat(),
-                        "schedule_start": schedule.get("start"),
-                        "schedule_end": schedule.get("end"),
-                    },
-                )
-                _LOGGER.info(
-                    "Schedule %s for slot %s (%s): code %s on lock",
-                    "started" if should_be_on_lock else "ended",
-                    slot,
-                    user_name,
-                    "set" if should_be_on_lock else "cleared",
-                )
-            except Exception as err:
-                _LOGGER.warning("Auto-schedule check failed for slot %s: %s", slot, err)
-            await asyncio.sleep(1)
+            changes.append((slot, user_data, should_be_on_lock))
+
+        if not changes:
+            return
+
+        semaphore = asyncio.Semaphore(SCHEDULE_PUSH_CONCURRENCY)
+
+        async def apply(slot: int, user_data: dict[str, Any], should_be_on_lock: bool) -> None:
+            async with semaphore:
+                await self._async_apply_schedule_change(slot, user_data, should_be_on_lock)
+
+        await asyncio.gather(*(apply(*change) for change in changes))
+
+    async def _async_apply_schedule_change(
+        self, slot: int, user_data: dict[str, Any], should_be_on_lock: bool
+    ) -> None:
+        """Push or clear one slot's code because its schedule started or ended."""
+        schedule = user_data.get("schedule", {})
+        try:
+            user_name = user_data.get("name", f"User {slot}")
+            if should_be_on_lock and not user_data.get("enabled", False):
+                user_data["enabled"] = True
+                user_data["lock_status"] = USER_STATUS_ENABLED
+                user_data["enabled_by_scheduler"] = True
+                # Persist the auto-enable before the (slow) Z-Wave push
+                await self.async_save_user_data()
+            await self._do_push_code_to_lock(slot)
+            now_iso = dt_util.utcnow().isoformat()
+            if not should_be_on_lock:
+                self._clear_slot_local_cache(slot)
+                await self.async_save_user_data()
+                self.data["last_user_update"] = now_iso
+                self.async_update_listeners()
+                if self._lock_entity:
+                    self.hass.loop.call_later(0.2, self._lock_entity.async_write_ha_state)
+            event_type = EVENT_SCHEDULE_STARTED if should_be_on_lock else EVENT_SCHEDULE_ENDED
+            self._fire_event(
+                event_type,
+                {
+                    "entity_id": self.lock_entity_id,
+                    "slot": slot,
+                    "user_name": user_name,
+                    "timestamp": now_iso,
+                    "schedule_start": schedule.get("start"),
+                    "schedule_end": schedule.get("end"),
+                },
+            )
+            _LOGGER.info(
+                "Schedule %s for slot %s (%s): code %s on lock",
+                "started" if should_be_on_lock else "ended",
+                slot,
+                user_name,
+                "set" if should_be_on_lock else "cleared",
+            )
+        except Exception as err:
+            _LOGGER.warning("Auto-schedule check failed for slot %s: %s", slot, err)
 
     async def async_pull_codes_from_lock(self) -> None:
         """Pull all codes from the lock and update our data."""
@@ -1504,24 +1752,39 @@ class YaleLockCoordinator(DataUpdateCoordinator):
         codes_updated = 0
         codes_new = 0
 
-        for slot in range(1, MAX_USER_SLOTS + 1):
-            _LOGGER.debug("Checking slot %s...", slot)
+        # A full pull always reads fresh from the lock
+        self._zwave_client.invalidate_slot_cache()
+
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+        info_enabled = _LOGGER.isEnabledFor(logging.INFO)
+
+        # Bind constants to locals for the per-slot loop
+        status_available = USER_STATUS_AVAILABLE
+        status_enabled = USER_STATUS_ENABLED
+        status_disabled = USER_STATUS_DISABLED
+        fob = CODE_TYPE_FOB
+        pin = CODE_TYPE_PIN
+        max_slots = MAX_USER_SLOTS
+        users = self._user_data["users"]
+
+        # Queries run ahead concurrently (bounded); results arrive in slot order
+        async for slot, data in self._zwave_client.iter_user_code_data(range(1, max_slots + 1)):
+            if debug_enabled:
+                _LOGGER.debug("Checking slot %s...", slot)
             
             # Fire progress event before processing slot
             self._fire_event(EVENT_REFRESH_PROGRESS, {
                 "action": "progress",
-                "total_slots": MAX_USER_SLOTS,
+                "total_slots": max_slots,
                 "current_slot": slot,
                 "codes_found": codes_found,
                 "codes_new": codes_new,
                 "codes_updated": codes_updated,
             })
             
-            # Use _get_user_code_data to get both status and code in one call
-            data = await self._get_user_code_data(slot)
-            
             if not data:
-                _LOGGER.debug("Slot %s - No data returned (empty or timeout)", slot)
+                if debug_enabled:
+                    _LOGGER.debug("Slot %s - No data returned (empty or timeout)", slot)
                 continue
             
             status = data.get("userIdStatus")
@@ -1533,23 +1796,23 @@ class YaleLockCoordinator(DataUpdateCoordinator):
             else:
                 code = ""
             
-            _LOGGER.debug("Slot %s - Status: %s, Code: %s", slot, status, "***" if code else "None")
+            if debug_enabled:
+                _LOGGER.debug("Slot %s - Status: %s, Code: %s", slot, status, _mask(code))
 
             # Convert status to int for comparison
-            status_int = int(status) if status is not None else USER_STATUS_AVAILABLE
-            
-            slot_str = str(slot)
+            status_int = int(status) if status is not None else status_available
             
             # Check if we already have this slot
-            if slot_str in self._user_data["users"]:
-                user_data = self._user_data["users"][slot_str]
-                cached_code_type = user_data.get("code_type", CODE_TYPE_PIN)
+            if slot in users:
+                user_data = users[slot]
+                cached_code_type = user_data.get("code_type", pin)
                 
                 # If slot is marked as FOB in cache, check if lock has PIN
-                if cached_code_type == CODE_TYPE_FOB:
+                if cached_code_type == fob:
                     # If lock has no PIN (AVAILABLE or no code), skip overwriting
-                    if status_int == USER_STATUS_AVAILABLE or not code:
-                        _LOGGER.debug("Slot %s: Marked as FOB, lock has no PIN - skipping overwrite", slot)
+                    if status_int == status_available or not code:
+                        if debug_enabled:
+                            _LOGGER.debug("Slot %s: Marked as FOB, lock has no PIN - skipping overwrite", slot)
                         # Still update lock_code and lock_status_from_lock for reference
                         user_data["lock_code"] = ""
                         user_data["lock_status_from_lock"] = status_int
@@ -1559,60 +1822,64 @@ class YaleLockCoordinator(DataUpdateCoordinator):
                         continue  # Skip the overwrite logic
                     
                     # If lock has a PIN (ENABLED with code), it was changed from FOB to PIN on lock
-                    if status_int == USER_STATUS_ENABLED and code:
+                    if status_int == status_enabled and code:
                         _LOGGER.info("Slot %s: Marked as FOB but lock has PIN - updating to PIN type", slot)
                         # Update code_type to PIN and proceed with normal overwrite logic
-                        user_data["code_type"] = CODE_TYPE_PIN
+                        user_data["code_type"] = pin
                         # Continue with normal PIN overwrite logic below
                 
                 # Update lock state
                 user_data["lock_code"] = code if code else ""
                 user_data["lock_status_from_lock"] = status_int
-                user_data["lock_enabled"] = (status_int == USER_STATUS_ENABLED)
+                user_data["lock_enabled"] = (status_int == status_enabled)
                 
                 # PIN Overwrite Logic (only for PIN slots, or FOB slots that were changed to PIN):
                 # - If status = ENABLED (1) AND code exists: Overwrite cached PIN
                 # - If status = AVAILABLE (0) OR DISABLED (2): Preserve cached PIN
-                if status_int == USER_STATUS_ENABLED and code:
+                if status_int == status_enabled and code:
                     # Lock is enabled with code - overwrite cached PIN (code was added directly to lock)
                     old_code = user_data.get("code", "")
                     if old_code != code:
-                        _LOGGER.info(
-                            "Slot %s: Lock enabled with code, overwriting cached PIN (old: '%s', new: '%s')",
-                            slot, "***" if old_code else "None", "***" if code else "None"
-                        )
+                        if info_enabled:
+                            _LOGGER.info(
+                                "Slot %s: Lock enabled with code, overwriting cached PIN (old: '%s', new: '%s')",
+                                slot, _mask(old_code), _mask(code)
+                            )
                         user_data["code"] = code
-                    else:
+                    elif debug_enabled:
                         _LOGGER.debug("Slot %s: Lock enabled, cached PIN matches lock code", slot)
                     codes_found += 1
                     codes_updated += 1
-                elif status_int == USER_STATUS_AVAILABLE:
+                elif status_int == status_available:
                     # Lock is available (cleared) - update cache to reflect cleared state
                     if not code or code == "":
                         # Lock is cleared (no code) - clear cached PIN and set status to DISABLED
                         old_cached_code = user_data.get("code", "")
                         if old_cached_code:
-                            _LOGGER.info(
-                                "Slot %s: Lock cleared (AVAILABLE, no code), clearing cached PIN '%s' and setting status to DISABLED",
-                                slot, "***" if old_cached_code else "None"
-                            )
+                            if info_enabled:
+                                _LOGGER.info(
+                                    "Slot %s: Lock cleared (AVAILABLE, no code), clearing cached PIN '%s' and setting status to DISABLED",
+                                    slot, _mask(old_cached_code)
+                                )
                             user_data["code"] = ""  # Clear cached PIN
-                            user_data["lock_status"] = USER_STATUS_DISABLED  # Set cached status to DISABLED
+                            user_data["lock_status"] = status_disabled  # Set cached status to DISABLED
                         else:
-                            _LOGGER.debug("Slot %s: Lock is AVAILABLE, cached PIN already empty", slot)
+                            if debug_enabled:
+                                _LOGGER.debug("Slot %s: Lock is AVAILABLE, cached PIN already empty", slot)
                             # Ensure cached status is DISABLED if not already set
-                            if user_data.get("lock_status") != USER_STATUS_DISABLED:
-                                user_data["lock_status"] = USER_STATUS_DISABLED
+                            if user_data.get("lock_status") != status_disabled:
+                                user_data["lock_status"] = status_disabled
                     else:
                         # Lock is AVAILABLE but has a code (shouldn't happen, but handle it)
-                        _LOGGER.warning("Slot %s: Lock status is AVAILABLE but has code '%s'", slot, "***" if code else "None")
+                        _LOGGER.warning("Slot %s: Lock status is AVAILABLE but has code '%s'", slot, _mask(code))
                     codes_updated += 1
-                elif status_int == USER_STATUS_DISABLED:
+                elif status_int == status_disabled:
                     # Lock is disabled (but has code) - preserve cached PIN and status
-                    _LOGGER.debug(
-                        "Slot %s: Lock status=DISABLED, preserving cached PIN '%s' and cached status",
-                        slot, "***" if user_data.get("code") else "None"
-                    )
+                    if debug_enabled:
+                        _LOGGER.debug(
+                            "Slot %s: Lock status=DISABLED, preserving cached PIN '%s' and cached status",
+                            slot, _mask(user_data.get("code"))
+                        )
                     # Update lock_status_from_lock but preserve cached lock_status
                     if code:
                         codes_found += 1
@@ -1622,61 +1889,45 @@ class YaleLockCoordinator(DataUpdateCoordinator):
                     _LOGGER.warning("Slot %s: Unknown status %s", slot, status_int)
                 
                 # Recalculate sync status (only for PIN slots)
-                current_code_type = user_data.get("code_type", CODE_TYPE_PIN)
-                if current_code_type == CODE_TYPE_FOB:
+                current_code_type = user_data.get("code_type", pin)
+                if current_code_type == fob:
                     # FOBs are always synced (they're managed directly on the lock)
                     user_data["synced_to_lock"] = True
                 else:
                     # PIN slots: calculate sync based on code and status
-                    cached_enabled = user_data.get("enabled", False)
-                    should_be_enabled = cached_enabled and self._is_code_valid(slot)
-                    lock_is_enabled = (status_int == USER_STATUS_ENABLED)
-                    
-                    # Synced if: code matches AND enabled state matches
-                    cached_code = user_data.get("code", "")
-                    if should_be_enabled:
-                        # Should be enabled: code must exist and match
-                        user_data["synced_to_lock"] = (
-                            lock_is_enabled and
-                            cached_code == code and
-                            cached_code != ""
-                        )
-                    else:
-                        # Should be disabled: code must NOT exist
-                        user_data["synced_to_lock"] = (
-                            status_int == USER_STATUS_AVAILABLE or
-                            code == ""
-                        )
+                    user_data["synced_to_lock"] = self._calculate_synced(slot, user_data, code, status_int)
                 
-                _LOGGER.info("Slot %s updated - Cached: %s, Lock: %s, Synced: %s", 
-                           slot, "***" if cached_code else "None", 
-                           "***" if code else "None", user_data["synced_to_lock"])
+                if info_enabled:
+                    _LOGGER.info("Slot %s updated - Cached: %s, Lock: %s, Synced: %s", 
+                               slot, _mask(user_data.get("code")), 
+                               _mask(code), user_data["synced_to_lock"])
             else:
                 # New slot found on lock
-                if status_int == USER_STATUS_AVAILABLE:
+                if status_int == status_available:
                     # Slot is empty - skip
-                    _LOGGER.debug("Slot %s is empty (AVAILABLE)", slot)
+                    if debug_enabled:
+                        _LOGGER.debug("Slot %s is empty (AVAILABLE)", slot)
                     continue
                 
                 codes_found += 1
                 _LOGGER.info("Slot %s is NEW (unknown code detected, status: %s)", slot, status_int)
                 
                 # Try to determine if it's a FOB
-                code_type = CODE_TYPE_PIN
+                code_type = pin
                 if code and (not code.isdigit() or len(code) < 4):
-                    code_type = CODE_TYPE_FOB
+                    code_type = fob
                     _LOGGER.debug("Detected as FOB based on code format")
 
                 # For new slots, use code from lock as cached code
-                self._user_data["users"][slot_str] = {
+                users[slot] = {
                     "name": f"User {slot}",
                     "code_type": code_type,
                     "code": code if code else "",  # Use code from lock for new slots
                     "lock_code": code if code else "",
-                    "enabled": (status_int == USER_STATUS_ENABLED),
+                    "enabled": (status_int == status_enabled),
                     "lock_status": status_int,
                     "lock_status_from_lock": status_int,
-                    "lock_enabled": (status_int == USER_STATUS_ENABLED),
+                    "lock_enabled": (status_int == status_enabled),
                     "schedule": {"start": None, "end": None},
                     "usage_limit": None,
                     "usage_count": 0,
@@ -1696,11 +1947,12 @@ class YaleLockCoordinator(DataUpdateCoordinator):
         # Log user data state before save
         total_users_in_memory = len(self._user_data["users"])
         _LOGGER.info("[REFRESH DEBUG] User data in memory: %s users", total_users_in_memory)
-        for slot_str, user_data in self._user_data["users"].items():
-            _LOGGER.debug("[REFRESH DEBUG] Slot %s: name=%s, lock_status=%s, lock_code=%s", 
-                         slot_str, user_data.get("name"), 
-                         user_data.get("lock_status"), 
-                         "***" if user_data.get("lock_code") else "None")
+        if debug_enabled:
+            for slot, user_data in self._user_data["users"].items():
+                _LOGGER.debug("[REFRESH DEBUG] Slot %s: name=%s, lock_status=%s, lock_code=%s", 
+                             slot, user_data.get("name"), 
+                             user_data.get("lock_status"), 
+                             _mask(user_data.get("lock_code")))
 
         # Fire complete event
         self._fire_event(EVENT_REFRESH_PROGRESS, {
@@ -1718,8 +1970,9 @@ class YaleLockCoordinator(DataUpdateCoordinator):
         
         # Update coordinator.data to trigger coordinator update cycle
         if self.data:
-            self.data["last_user_update"] = dt_util.utcnow().isoformat()
-            _LOGGER.debug("[REFRESH DEBUG] Updated coordinator.data with timestamp: %s", self.data["last_user_update"])
+            now_iso = dt_util.utcnow().isoformat()
+            self.data["last_user_update"] = now_iso
+            _LOGGER.debug("[REFRESH DEBUG] Updated coordinator.data with timestamp: %s", now_iso)
         
         # Trigger listeners to notify CoordinatorEntity
         self.async_update_listeners()
@@ -1749,12 +2002,11 @@ class YaleLockCoordinator(DataUpdateCoordinator):
         """
         _LOGGER.info("Checking sync status for slot %s...", slot)
         
-        slot_str = str(slot)
-        if slot_str not in self._user_data["users"]:
+        if slot not in self._user_data["users"]:
             _LOGGER.warning("Slot %s not found in user data", slot)
             return
         
-        user_data = self._user_data["users"][slot_str]
+        user_data = self._user_data["users"][slot]
         
         # Query the lock to get current lock PIN and status
         lock_data = await self._get_user_code_data(slot)
@@ -1794,14 +2046,22 @@ class YaleLockCoordinator(DataUpdateCoordinator):
     async def async_load_user_data(self) -> None:
         """Load user data from storage."""
         await self._storage.load()
+        self._users_version += 1
 
     async def async_save_user_data(self) -> None:
         """Save user data to storage."""
+        self._users_version += 1
         await self._storage.save()
 
+    async def async_flush_user_data(self) -> None:
+        """Write any pending user data save to disk now."""
+        await self._storage.flush()
+
     async def async_clear_local_cache(self) -> None:
         """Clear all local user data cache."""
-        await self._storage.clear()
+        if not await self._storage.clear():
+            return
+        self._users_version += 1
         await self.async_request_refresh()
 
     async def async_import_user_data(self, data: dict[str, Any]) -> None:
@@ -1811,23 +2071,93 @@ class YaleLockCoordinator(DataUpdateCoordinator):
         users = data["users"]
         if not isinstance(users, dict):
             raise ValueError("Invalid import data: 'users' must be a dict")
-        # Replace all users with deep copy (storage handles deep copy)
-        self._storage.replace_users(users)
+        # JSON round-trip: storage takes ownership, so detach from the service
+        # call data; also guarantees the users are JSON-storable
+        self._storage.replace_users(json_loads(json_dumps(users)))
         await self.async_save_user_data()
         await self.async_request_refresh()
         _LOGGER.info("Imported user data: %s slots", len(users))
 
+    @property
+    def users_version(self) -> int:
+        """Counter that changes whenever user data is loaded or saved.
+
+        Every user-data mutation is followed by a save, so entities can
+        reuse a users snapshot while this value is unchanged.
+        """
+        return self._users_version
+
+    @cached_property
+    def device_info(self) -> DeviceInfo:
+        """Device info for the Yale Lock Manager device.
+
+        Built once per config entry and shared by reference across every
+        platform's entities.
+
+        No via_device: linking to the Z-Wave device triggers a deprecation
+        warning and the relationship is implicit through the node_id. If it is
+        ever needed, resolve it with device_registry.async_get_device(identifiers=...)
+        (hashed lookup) rather than scanning every registered device.
+        """
+        return DeviceInfo(
+            identifiers=self.device_identifiers,
+            name=f"{self.lock_name} Manager",
+            manufacturer="Yale Lock Manager",
+            model="Lock Code Manager",
+            sw_version=VERSION,
+        )
+
+    @property
+    def recent_access(self) -> tuple[datetime | None, str | None]:
+        """Return (timestamp, user name) of the most recent code use.
+
+        Scanned once per users_version and shared by the Last Access and
+        Last User sensors instead of each sensor walking every user.
+        """
+        if self._recent_access_version != self._users_version:
+            self._recent_access = max(
+                _iter_parsed_accesses(self._storage.get_all_users()),
+                key=itemgetter(0),
+                default=(None, None),
+            )
+            self._recent_access_version = self._users_version
+        return self._recent_access
+
     @property
     def user_data(self) -> dict[str, Any]:
-        """Get user data."""
+        """Get the live user data (int slot keys); read-only use, e.g. export."""
         return self._storage.data
 
     def get_user(self, slot: int) -> dict[str, Any] | None:
         """Get user data for a specific slot."""
         return self._storage.get_user(slot)
 
-    def get_all_users(self) -> dict[str, Any]:
-        """Get all users."""
+    def get_all_users(self) -> Mapping[int, Any]:
+        """Get all users, keyed by int slot.
+
+        Returns a read-only live view of storage, not a copy. Entities deriving values
+        from it should cache them against users_version (see recent_access)
+        rather than rescanning on every state read.
+        """
         users = self._storage.get_all_users()
         self._logger.debug_refresh("get_all_users() called", users_count=len(users))
         return users
+
+
+@callback
+def async_get_coordinator(
+    hass: HomeAssistant, entity_id: str | None = None
+) -> YaleLockCoordinator | None:
+    """Return the coordinator that owns entity_id (e.g. the card's lock entity).
+
+    Falls back to the first loaded lock when no entity is given or it is not
+    one of this integration's entities; None only if no lock is loaded.
+    Shared by the services and the websocket commands.
+    """
+    domain_data = hass.data.get(DOMAIN) or {}
+    if entity_id:
+        entity_entry = er.async_get(hass).async_get(entity_id)
+        if entity_entry is not None and entity_entry.config_entry_id in domain_data:
+            return domain_data[entity_entry.config_entry_id]
+    # First coordinator, without building a list of all of them
+    return next(iter(domain_data.values()), None)
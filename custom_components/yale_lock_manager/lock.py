@@ -6,13 +6,12 @@ from typing import Any
 
 from homeassistant.components.lock import LockEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
-import homeassistant.helpers.device_registry as dr
 
-from .const import CONF_LOCK_NAME, DOMAIN, ZWAVE_JS_DOMAIN
+from .const import DOMAIN
 from .coordinator import YaleLockCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -45,66 +44,37 @@ class YaleLockManagerLock(CoordinatorEntity, LockEntity):
         # Register this entity with the coordinator so it can notify us of state changes
         coordinator.register_lock_entity(self)
         
-        # Get the lock name from config entry
-        lock_name = entry.data.get(CONF_LOCK_NAME, "Yale Lock")
+        # Lock name, read once from the config entry by the coordinator
+        lock_name = coordinator.lock_name
         
         # Use a unique ID that won't conflict with Z-Wave lock
         self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_lock"
         self._attr_name = f"{lock_name} Manager"
         
-        # Try to find the Z-Wave device in the device registry for via_device
-        via_device_id = None
-        device_registry = dr.async_get(coordinator.hass)
-        for device in device_registry.devices.values():
-            # Check if this device is from zwave_js and matches our node_id
-            zwave_identifiers = [
-                identifier for identifier in device.identifiers 
-                if identifier[0] == ZWAVE_JS_DOMAIN
-            ]
-            if zwave_identifiers:
-                # Z-Wave device identifier format is (zwave_js, "node_id-endpoint")
-                identifier = zwave_identifiers[0]
-                node_id_str = identifier[1].split("-")[0]  # Get node_id part
-                if node_id_str == str(coordinator.node_id):
-                    via_device_id = device.id
-                    break
-        
         # Create our own separate device
-        device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": f"{lock_name} Manager",
-            "manufacturer": "Yale Lock Manager",
-            "model": "Lock Code Manager",
-            "sw_version": coordinator.hass.data[DOMAIN].get("version", "1.0.0"),
-        }
-        
-        # Only add via_device if we found the Z-Wave device AND it still exists
-        # Note: We don't add via_device to avoid the deprecation warning
-        # The device relationship is implicit through the node_id matching
-        # If needed in the future, we can use device_links instead
-        # if via_device_id:
-        #     # Verify the device still exists before using it as via_device
-        #     existing_device = device_registry.async_get(via_device_id)
-        #     if existing_device:
-        #         device_info["via_device"] = via_device_id
-        #     else:
-        #         _LOGGER.warning(
-        #             "Z-Wave device %s not found in device registry, skipping via_device",
-        #             via_device_id
-        #         )
-        
-        self._attr_device_info = device_info
+        self._attr_device_info = coordinator.device_info
+
+        # extra_state_attributes cache; rebuilt after each coordinator update
+        self._attrs_cache: dict[str, Any] | None = None
+        # Last users snapshot (users, total_users, enabled_users) and its key
+        self._users_snapshot: tuple[dict[str, Any], int, int] | None = None
+        self._users_snapshot_key: tuple[int, tuple[bool, ...]] | None = None
         
         _LOGGER.info("Created Yale Lock Manager device '%s' for entry %s", lock_name, entry.entry_id)
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Invalidate cached attributes before writing the new state."""
+        self._attrs_cache = None
+        super()._handle_coordinator_update()
+
     @property
     def is_locked(self) -> bool | None:
         """Return true if the lock is locked."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
-
-        lock_state = self.coordinator.data.get("lock_state")
-        return lock_state == "locked"
+        return data.get("lock_state") == "locked"
 
     @property
     def is_jammed(self) -> bool:
@@ -115,22 +85,30 @@ class YaleLockManagerLock(CoordinatorEntity, LockEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.coordinator.last_update_success and self.coordinator.data is not None
+        coordinator = self.coordinator
+        return coordinator.last_update_success and coordinator.data is not None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
+        """Return the state attributes.
+
+        Built once per coordinator update and reused for further reads
+        (e.g. the delayed state write the coordinator schedules).
+        """
+        if self._attrs_cache is not None:
+            return self._attrs_cache
         _LOGGER.debug("[REFRESH DEBUG] extra_state_attributes property called")
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             _LOGGER.debug("[REFRESH DEBUG] extra_state_attributes: coordinator.data is None, returning empty dict")
             return {}
 
         attrs = {}
 
         # Add door and bolt status
-        door_status = self.coordinator.data.get("door_status")
-        bolt_status = self.coordinator.data.get("bolt_status")
-        battery_level = self.coordinator.data.get("battery_level")
+        door_status = data.get("door_status")
+        bolt_status = data.get("bolt_status")
+        battery_level = data.get("battery_level")
 
         if door_status:
             attrs["door_status"] = door_status
@@ -140,54 +118,77 @@ class YaleLockManagerLock(CoordinatorEntity, LockEntity):
             attrs["battery_level"] = battery_level
 
         # Add user data for the card
-        # CRITICAL: Create a deep copy so Home Assistant detects it as a new object
-        # This forces Home Assistant to broadcast the change to frontend
-        users_raw = self.coordinator.get_all_users()
-        users = {}
-        for slot_str, user_data in users_raw.items():
-            # Create a new dict for each user to ensure new object references
-            users[slot_str] = dict(user_data)
-            users[slot_str]["schedule_valid_now"] = self.coordinator._is_code_valid(int(slot_str))
-            users[slot_str].setdefault("enabled_by_scheduler", False)
-            users[slot_str].setdefault("do_not_auto_enable", False)
+        users, total_users, enabled_users = self._get_users_snapshot()
         
-        enabled_users = [u for u in users.values() if u.get("enabled")]
-        total_users = len([u for u in users.values() if u.get("name")])
         attrs["total_users"] = total_users
-        attrs["enabled_users"] = len(enabled_users)
+        attrs["enabled_users"] = enabled_users
         
         # Expose full user data for the Lovelace card
         attrs["users"] = users
         
         # Add last access information for activity log
-        attrs["last_access_user"] = self.coordinator.data.get("last_access_user", "Unknown")
-        attrs["last_access_method"] = self.coordinator.data.get("last_access_method", "Unknown")
-        attrs["last_access_timestamp"] = self.coordinator.data.get("last_access_timestamp")
+        attrs["last_access_user"] = data.get("last_access_user", "Unknown")
+        attrs["last_access_method"] = data.get("last_access_method", "Unknown")
+        attrs["last_access_timestamp"] = data.get("last_access_timestamp")
 
         # Expose current HA system time for schedule debugging
         attrs["current_time_iso"] = dt_util.now().isoformat()
         
         _LOGGER.info("[REFRESH DEBUG] extra_state_attributes: returning %s users (total_users=%s, enabled_users=%s)", 
-                     len(users), total_users, len(enabled_users))
+                     len(users), total_users, enabled_users)
 
+        self._attrs_cache = attrs
         return attrs
 
+    def _get_users_snapshot(self) -> tuple[dict[str, Any], int, int]:
+        """Return (users, total_users, enabled_users) for the state attributes.
+
+        The same snapshot object is returned until user data is saved again
+        or a slot's schedule validity changes, so unchanged users are not
+        copied (or re-sent) on every state write.
+        """
+        users_raw = self.coordinator.get_all_users()
+        valid_now = tuple(self.coordinator._is_code_valid(slot) for slot in users_raw)
+        key = (self.coordinator.users_version, valid_now)
+        if self._users_snapshot is not None and key == self._users_snapshot_key:
+            return self._users_snapshot
+
+        # CRITICAL: Create a deep copy so Home Assistant detects it as a new object
+        # This forces Home Assistant to broadcast the change to frontend
+        users = {}
+        total_users = enabled_users = 0
+        for (slot, user_data), schedule_valid_now in zip(users_raw.items(), valid_now):
+            # Create a new dict for each user to ensure new object references
+            user = dict(user_data)
+            user["schedule_valid_now"] = schedule_valid_now
+            user.setdefault("enabled_by_scheduler", False)
+            user.setdefault("do_not_auto_enable", False)
+            # The card reads users by string slot key
+            users[str(slot)] = user
+            # Count in the same pass
+            if user.get("name"):
+                total_users += 1
+            if user.get("enabled"):
+                enabled_users += 1
+
+        self._users_snapshot = (users, total_users, enabled_users)
+        self._users_snapshot_key = key
+        return self._users_snapshot
+
     async def async_lock(self, **kwargs: Any) -> None:
         """Lock the lock."""
-        await self.hass.services.async_call(
-            "lock",
-            "lock",
-            {"entity_id": self.coordinator.lock_entity_id},
-            blocking=True,
-        )
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_run_single_flight("lock_state", True, self._async_do_lock)
 
     async def async_unlock(self, **kwargs: Any) -> None:
         """Unlock the lock."""
-        await self.hass.services.async_call(
-            "lock",
-            "unlock",
-            {"entity_id": self.coordinator.lock_entity_id},
-            blocking=True,
-        )
+        await self.coordinator.async_run_single_flight("lock_state", False, self._async_do_unlock)
+
+    async def _async_do_lock(self) -> None:
+        """Send lock to the Z-Wave lock and refresh."""
+        await self.coordinator.async_set_locked(True, self._context)
+        await self.coordinator.async_request_refresh()
+
+    async def _async_do_unlock(self) -> None:
+        """Send unlock to the Z-Wave lock and refresh."""
+        await self.coordinator.async_set_locked(False, self._context)
         await self.coordinator.async_request_refresh()
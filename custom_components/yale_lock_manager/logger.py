@@ -6,6 +6,16 @@ from typing import Any
 
 _LOGGER = logging.getLogger(__name__)
 
+_CTX_JOIN = " ".join
+
+
+def _fmt_ctx(kwargs: dict[str, Any]) -> str:
+    """Format structured context as "key=value key=value" ("" if empty)."""
+    if not kwargs:
+        return ""
+    # A list comprehension is faster than a generator for str.join
+    return _CTX_JOIN([f"{k}={v}" for k, v in kwargs.items()])
+
 
 class YaleLockLogger:
     """Structured logger for Yale Lock Manager with context-aware logging."""
@@ -20,91 +30,116 @@ class YaleLockLogger:
         """Enable or disable debug mode."""
         self._debug_mode = enabled
 
+    def isEnabledFor(self, level: int) -> bool:
+        """Return True if a message at this level would be emitted.
+
+        Mirrors logging.Logger.isEnabledFor so callers can skip building
+        log arguments; DEBUG additionally requires debug mode.
+        """
+        if level <= logging.DEBUG and not self._debug_mode:
+            return False
+        return self._logger.isEnabledFor(level)
+
     def debug_refresh(self, message: str, **kwargs: Any) -> None:
         """Log refresh-specific debug message."""
-        if self._debug_mode:
-            context = " ".join(f"{k}={v}" for k, v in kwargs.items())
-            full_message = f"[REFRESH DEBUG] {message}"
-            if context:
-                full_message += f" - {context}"
-            self._logger.debug(full_message)
+        if not self._debug_mode or not self._logger.isEnabledFor(logging.DEBUG):
+            return
+        if kwargs:
+            self._logger.debug(
+                "[REFRESH DEBUG] %s - %s", message, _fmt_ctx(kwargs), extra={"ctx": kwargs}
+            )
+        else:
+            self._logger.debug("[REFRESH DEBUG] %s", message, extra={"ctx": kwargs})
 
     def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log debug message.
         
         Supports both old-style formatting (message % args) and new-style (kwargs).
         """
-        if self._debug_mode or kwargs.pop("force", False):
-            # If args are provided, use old-style string formatting
-            if args:
-                formatted_message = message % args
-            else:
-                formatted_message = message
-            
-            context = " ".join(f"{k}={v}" for k, v in kwargs.items())
-            full_message = formatted_message
-            if context:
-                full_message += f" - {context}"
-            self._logger.debug(full_message)
+        force = kwargs.pop("force", False)
+        if not (self._debug_mode or force) or not self._logger.isEnabledFor(logging.DEBUG):
+            return
+        # If args are provided, use old-style string formatting
+        if args:
+            formatted_message = message % args
+        else:
+            formatted_message = message
+        
+        context = _fmt_ctx(kwargs)
+        full_message = formatted_message
+        if context:
+            full_message += f" - {context}"
+        self._logger.debug(full_message, extra={"ctx": kwargs})
 
     def info_operation(self, operation: str, slot: int | None = None, **kwargs: Any) -> None:
         """Log operation info message."""
+        if not self._logger.isEnabledFor(logging.INFO):
+            return
         message = f"{operation}"
         if slot is not None:
             message += f" for slot {slot}"
-        context = " ".join(f"{k}={v}" for k, v in kwargs.items())
+        context = _fmt_ctx(kwargs)
         if context:
             message += f" - {context}"
-        self._logger.info(message)
+        self._logger.info(message, extra={"ctx": kwargs})
 
     def info(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log info message.
         
         Supports both old-style formatting (message % args) and new-style (kwargs).
         """
+        if not self._logger.isEnabledFor(logging.INFO):
+            return
         # If args are provided, use old-style string formatting
         if args:
             formatted_message = message % args
         else:
             formatted_message = message
         
-        context = " ".join(f"{k}={v}" for k, v in kwargs.items())
+        context = _fmt_ctx(kwargs)
         full_message = formatted_message
         if context:
             full_message += f" - {context}"
-        self._logger.info(full_message)
+        self._logger.info(full_message, extra={"ctx": kwargs})
 
     def warning(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log warning message.
         
         Supports both old-style formatting (message % args) and new-style (kwargs).
         """
+        if not self._logger.isEnabledFor(logging.WARNING):
+            return
         # If args are provided, use old-style string formatting
         if args:
             formatted_message = message % args
         else:
             formatted_message = message
         
-        context = " ".join(f"{k}={v}" for k, v in kwargs.items())
+        context = _fmt_ctx(kwargs)
         full_message = formatted_message
         if context:
             full_message += f" - {context}"
-        self._logger.warning(full_message)
+        self._logger.warning(full_message, extra={"ctx": kwargs})
 
     def error_zwave(self, operation: str, error: Exception | str, **kwargs: Any) -> None:
         """Log Z-Wave specific error."""
+        if not self._logger.isEnabledFor(logging.ERROR):
+            return
         error_msg = str(error) if isinstance(error, Exception) else error
         message = f"Z-Wave {operation} failed: {error_msg}"
-        context = " ".join(f"{k}={v}" for k, v in kwargs.items())
+        context = _fmt_ctx(kwargs)
         if context:
             message += f" - {context}"
-        self._logger.error(message, exc_info=isinstance(error, Exception))
+        self._logger.error(message, exc_info=isinstance(error, Exception), extra={"ctx": kwargs})
 
     def error(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log error message.
         
         Supports both old-style formatting (message % args) and new-style (kwargs).
         """
+        exc_info = kwargs.pop("exc_info", False)
+        if not self._logger.isEnabledFor(logging.ERROR):
+            return
         # If args are provided, use old-style string formatting
         if args:
             try:
@@ -116,8 +151,8 @@ class YaleLockLogger:
         else:
             formatted_message = message
         
-        context = " ".join(f"{k}={v}" for k, v in kwargs.items())
+        context = _fmt_ctx(kwargs)
         full_message = formatted_message
         if context:
             full_message += f" - {context}"
-        self._logger.error(full_message, exc_info=kwargs.pop("exc_info", False))
+        self._logger.error(full_message, exc_info=exc_info, extra={"ctx": kwargs})
@@ -2,17 +2,15 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
 
 from homeassistant.components.number import NumberEntity, NumberMode
-from homeassistant.components.zwave_js import DOMAIN as ZWAVE_JS_DOMAIN
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_LOCK_NAME, DOMAIN
+from .const import DOMAIN
 from .coordinator import YaleLockCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -52,41 +50,40 @@ class YaleLockManualRelockTime(CoordinatorEntity, NumberEntity):
         super().__init__(coordinator)
         self._attr_unique_id = f"{entry.entry_id}_manual_relock_time"
         self._attr_name = "Manual Relock Time"
-        lock_name = entry.data.get(CONF_LOCK_NAME, "Yale Lock")
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": f"{lock_name} Manager",
-            "manufacturer": "Yale Lock Manager",
-            "model": "Lock Code Manager",
-        }
+        self._attr_device_info = coordinator.device_info
         self._config_parameter = 3
+        self._data_key = "manual_relock_time"
 
     @property
     def native_value(self) -> float | None:
         """Return the current value."""
         # Try to get from lock entity attributes or coordinator data
-        if self.coordinator.data:
-            return self.coordinator.data.get("manual_relock_time", 7)
+        data = self.coordinator.data
+        if data:
+            return data.get("manual_relock_time", 7)
         return 7  # Default value
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the relock time."""
+        value = int(value)
+        # The number card often re-sends the current value; skip the Z-Wave write
+        if (self.coordinator.data or {}).get(self._data_key) == value:
+            return
+        await self.coordinator.async_run_single_flight(
+            ("config_parameter", self._config_parameter),
+            value,
+            lambda: self._async_write_value(value),
+        )
+
+    async def _async_write_value(self, value: int) -> None:
+        """Write the relock time to the lock and update entity state."""
         try:
-            await self.hass.services.async_call(
-                ZWAVE_JS_DOMAIN,
-                "set_config_parameter",
-                {
-                    "entity_id": self.coordinator.lock_entity_id,
-                    "parameter": self._config_parameter,
-                    "value": int(value),
-                },
-                blocking=True,
-            )
-            _LOGGER.info("Set manual relock time to %s seconds", int(value))
-            # Update coordinator data
+            await self.coordinator.async_set_config_parameter(self._config_parameter, value)
+            _LOGGER.info("Set manual relock time to %s seconds", value)
+            # The write is authoritative: update entities without re-polling the lock
             if self.coordinator.data:
-                self.coordinator.data["manual_relock_time"] = int(value)
-            await self.coordinator.async_request_refresh()
+                self.coordinator.data[self._data_key] = value
+            self.coordinator.async_update_listeners()
         except Exception as err:
             _LOGGER.error("Error setting manual relock time: %s", err)
 
@@ -111,40 +108,39 @@ class YaleLockRemoteRelockTime(CoordinatorEntity, NumberEntity):
         super().__init__(coordinator)
         self._attr_unique_id = f"{entry.entry_id}_remote_relock_time"
         self._attr_name = "Remote Relock Time"
-        lock_name = entry.data.get(CONF_LOCK_NAME, "Yale Lock")
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": f"{lock_name} Manager",
-            "manufacturer": "Yale Lock Manager",
-            "model": "Lock Code Manager",
-        }
+        self._attr_device_info = coordinator.device_info
         self._config_parameter = 6
+        self._data_key = "remote_relock_time"
 
     @property
     def native_value(self) -> float | None:
         """Return the current value."""
         # Try to get from lock entity attributes or coordinator data
-        if self.coordinator.data:
-            return self.coordinator.data.get("remote_relock_time", 10)
+        data = self.coordinator.data
+        if data:
+            return data.get("remote_relock_time", 10)
         return 10  # Default value
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the relock time."""
+        value = int(value)
+        # The number card often re-sends the current value; skip the Z-Wave write
+        if (self.coordinator.data or {}).get(self._data_key) == value:
+            return
+        await self.coordinator.async_run_single_flight(
+            ("config_parameter", self._config_parameter),
+            value,
+            lambda: self._async_write_value(value),
+        )
+
+    async def _async_write_value(self, value: int) -> None:
+        """Write the relock time to the lock and update entity state."""
         try:
-            await self.hass.services.async_call(
-                ZWAVE_JS_DOMAIN,
-                "set_config_parameter",
-                {
-                    "entity_id": self.coordinator.lock_entity_id,
-                    "parameter": self._config_parameter,
-                    "value": int(value),
-                },
-                blocking=True,
-            )
-            _LOGGER.info("Set remote relock time to %s seconds", int(value))
-            # Update coordinator data
+            await self.coordinator.async_set_config_parameter(self._config_parameter, value)
+            _LOGGER.info("Set remote relock time to %s seconds", value)
+            # The write is authoritative: update entities without re-polling the lock
             if self.coordinator.data:
-                self.coordinator.data["remote_relock_time"] = int(value)
-            await self.coordinator.async_request_refresh()
+                self.coordinator.data[self._data_key] = value
+            self.coordinator.async_update_listeners()
         except Exception as err:
             _LOGGER.error("Error setting remote relock time: %s", err)
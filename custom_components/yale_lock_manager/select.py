@@ -1,21 +1,27 @@
 """Select platform for Yale Lock Manager."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Mapping
 import logging
-from typing import Any
+from types import MappingProxyType
+from typing import ClassVar
 
 from homeassistant.components.select import SelectEntity
-from homeassistant.components.zwave_js import DOMAIN as ZWAVE_JS_DOMAIN
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_LOCK_NAME, DOMAIN
+from .const import DOMAIN, VOLUME_OPTIONS
 from .coordinator import YaleLockCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Coordinator-backed; no per-entity polling or I/O to serialize
+PARALLEL_UPDATES = 0
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -35,7 +41,13 @@ class YaleLockVolumeSelect(CoordinatorEntity, SelectEntity):
 
     _attr_has_entity_name = True
     _attr_icon = "mdi:volume-high"
-    _attr_options = ["Silent", "Low", "High"]
+    _attr_options = list(VOLUME_OPTIONS)
+
+    # Option <-> config parameter value; identical for every lock
+    _VALUE_MAP: ClassVar[Mapping[str, int]] = MappingProxyType(VOLUME_OPTIONS)
+    _REVERSE_MAP: ClassVar[Mapping[int, str]] = MappingProxyType(
+        {v: k for k, v in _VALUE_MAP.items()}
+    )
 
     def __init__(
         self,
@@ -46,52 +58,35 @@ class YaleLockVolumeSelect(CoordinatorEntity, SelectEntity):
         super().__init__(coordinator)
         self._attr_unique_id = f"{entry.entry_id}_volume"
         self._attr_name = "Volume"
-        lock_name = entry.data.get(CONF_LOCK_NAME, "Yale Lock")
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": f"{lock_name} Manager",
-            "manufacturer": "Yale Lock Manager",
-            "model": "Lock Code Manager",
-        }
-        self._config_parameter = 1
-        self._value_map = {
-            "Silent": 1,
-            "Low": 2,
-            "High": 3,
-        }
-        self._reverse_map = {v: k for k, v in self._value_map.items()}
+        self._attr_device_info = coordinator.device_info
+        # Serializes volume writes from rapid UI changes
+        self._op_lock = asyncio.Lock()
 
     @property
     def current_option(self) -> str | None:
         """Return the current volume setting."""
         if self.coordinator.data:
             volume_value = self.coordinator.data.get("volume", 2)
-            return self._reverse_map.get(volume_value, "Low")
+            return self._REVERSE_MAP.get(volume_value, "Low")
         return "Low"  # Default
 
     async def async_select_option(self, option: str) -> None:
         """Change the volume setting."""
-        if option not in self._value_map:
+        if option not in self._VALUE_MAP:
             _LOGGER.error("Invalid volume option: %s", option)
             return
 
-        value = self._value_map[option]
-        
-        try:
-            await self.hass.services.async_call(
-                ZWAVE_JS_DOMAIN,
-                "set_config_parameter",
-                {
-                    "entity_id": self.coordinator.lock_entity_id,
-                    "parameter": self._config_parameter,
-                    "value": value,
-                },
-                blocking=True,
-            )
-            _LOGGER.info("Set volume to %s (value: %s)", option, value)
-            # Update coordinator data
-            if self.coordinator.data:
-                self.coordinator.data["volume"] = value
-            await self.coordinator.async_request_refresh()
-        except Exception as err:
-            _LOGGER.error("Error setting volume: %s", err)
+        value = self._VALUE_MAP[option]
+        async with self._op_lock:
+            # Re-selecting the current option would still cost a Z-Wave round-trip;
+            # checked under the lock so a queued repeat of the last write is skipped
+            if (self.coordinator.data or {}).get("volume") == value:
+                return
+
+            try:
+                await self.coordinator.async_set_volume(value)
+            except (HomeAssistantError, asyncio.TimeoutError) as err:
+                _LOGGER.error("Error setting volume: %s", err)
+                return
+
+        _LOGGER.info("Set volume to %s (value: %s)", option, value)
@@ -1,13 +1,18 @@
 """Services for Yale Lock Manager."""
 from __future__ import annotations
 
+import asyncio
+from datetime import datetime, tzinfo
 import logging
+from typing import Final
 
 import voluptuous as vol
 
+from homeassistant.const import ATTR_ENTITY_ID
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
+from homeassistant.util import dt as dt_util
 
 from .const import (
     ATTR_CODE,
@@ -22,6 +27,7 @@ from .const import (
     ATTR_SLOT,
     ATTR_START_DATETIME,
     ATTR_STATUS,
+    ATTR_VOLUME,
     CODE_TYPE_FOB,
     CODE_TYPE_PIN,
     DOMAIN,
@@ -43,38 +49,54 @@ from .const import (
     SERVICE_SET_USER_STATUS,
     SERVICE_CLEAR_LOCAL_CACHE,
     SERVICE_IMPORT_USER_DATA,
+    SERVICE_SET_VOLUME_ALL,
     USER_STATUS_AVAILABLE,
     USER_STATUS_DISABLED,
     USER_STATUS_ENABLED,
+    VOLUME_OPTIONS,
 )
-from .coordinator import YaleLockCoordinator
+from .coordinator import YaleLockCoordinator, async_get_coordinator
 
 _LOGGER = logging.getLogger(__name__)
 
 # Service schemas
+# voluptuous compiles each schema once, here at import; per-call validation is
+# negligible next to the Z-Wave round-trip every handler makes, and Home
+# Assistant's service registry expects voluptuous schemas
+
+# Validator fragments shared by the schemas below
+_ENTITY_ID = vol.Optional(ATTR_ENTITY_ID)
+_SLOT = vol.Required(ATTR_SLOT)
+_SLOT_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_USER_SLOTS))
+_STATUS_VALIDATOR = vol.In([USER_STATUS_AVAILABLE, USER_STATUS_ENABLED, USER_STATUS_DISABLED])
+
+# Services that take only an optional lock entity
+ENTITY_ONLY_SCHEMA = vol.Schema({_ENTITY_ID: cv.entity_id})
+
+# Services that take only a slot (plus optional lock entity)
+SLOT_ONLY_SCHEMA = vol.Schema(
+    {
+        _ENTITY_ID: cv.entity_id,
+        _SLOT: _SLOT_VALIDATOR,
+    }
+)
+
 SET_USER_CODE_SCHEMA = vol.Schema(
     {
-        vol.Optional("entity_id"): cv.entity_id,
-        vol.Required(ATTR_SLOT): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_USER_SLOTS)),
+        _ENTITY_ID: cv.entity_id,
+        _SLOT: _SLOT_VALIDATOR,
         vol.Optional(ATTR_CODE, default=""): cv.string,  # Made optional for FOBs
         vol.Required(ATTR_NAME): cv.string,
         vol.Optional(ATTR_CODE_TYPE, default=CODE_TYPE_PIN): vol.In([CODE_TYPE_PIN, CODE_TYPE_FOB]),
         vol.Optional(ATTR_OVERRIDE_PROTECTION, default=False): cv.boolean,
-        vol.Optional(ATTR_STATUS): vol.In([USER_STATUS_AVAILABLE, USER_STATUS_ENABLED, USER_STATUS_DISABLED]),
-    }
-)
-
-CLEAR_USER_CODE_SCHEMA = vol.Schema(
-    {
-        vol.Optional("entity_id"): cv.entity_id,
-        vol.Required(ATTR_SLOT): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_USER_SLOTS)),
+        vol.Optional(ATTR_STATUS): _STATUS_VALIDATOR,
     }
 )
 
 SET_USER_SCHEDULE_SCHEMA = vol.Schema(
     {
-        vol.Optional("entity_id"): cv.entity_id,
-        vol.Required(ATTR_SLOT): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_USER_SLOTS)),
+        _ENTITY_ID: cv.entity_id,
+        _SLOT: _SLOT_VALIDATOR,
         vol.Optional(ATTR_START_DATETIME): vol.Any(None, cv.datetime),  # Allow None
         vol.Optional(ATTR_END_DATETIME): vol.Any(None, cv.datetime),    # Allow None
     }
@@ -82,97 +104,94 @@ SET_USER_SCHEDULE_SCHEMA = vol.Schema(
 
 SET_USAGE_LIMIT_SCHEMA = vol.Schema(
     {
-        vol.Optional("entity_id"): cv.entity_id,
-        vol.Required(ATTR_SLOT): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_USER_SLOTS)),
+        _ENTITY_ID: cv.entity_id,
+        _SLOT: _SLOT_VALIDATOR,
         vol.Optional(ATTR_MAX_USES): vol.Any(None, vol.All(vol.Coerce(int), vol.Range(min=1))),
     }
 )
 
 SET_NOTIFICATION_ENABLED_SCHEMA = vol.Schema(
     {
-        vol.Optional("entity_id"): cv.entity_id,
-        vol.Required(ATTR_SLOT): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_USER_SLOTS)),
+        _ENTITY_ID: cv.entity_id,
+        _SLOT: _SLOT_VALIDATOR,
         vol.Required(ATTR_ENABLED): cv.boolean,
         vol.Optional(ATTR_NOTIFICATION_SERVICE): cv.string,  # Deprecated, use ATTR_NOTIFICATION_SERVICES
         vol.Optional(ATTR_NOTIFICATION_SERVICES): vol.Any([cv.string], cv.string),  # Accept list or single string
     }
 )
 
-SEND_TEST_NOTIFICATION_SCHEMA = vol.Schema(
+SET_USER_STATUS_SCHEMA = vol.Schema(
     {
-        vol.Optional("entity_id"): cv.entity_id,
-        vol.Required(ATTR_SLOT): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_USER_SLOTS)),
+        _ENTITY_ID: cv.entity_id,
+        _SLOT: _SLOT_VALIDATOR,
+        vol.Required(ATTR_STATUS): _STATUS_VALIDATOR,
     }
 )
 
-PUSH_CODE_TO_LOCK_SCHEMA = vol.Schema(
+IMPORT_USER_DATA_SCHEMA = vol.Schema(
     {
-        vol.Optional("entity_id"): cv.entity_id,
-        vol.Required(ATTR_SLOT): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_USER_SLOTS)),
+        _ENTITY_ID: cv.entity_id,
+        vol.Required("data"): dict,
     }
 )
 
-PULL_CODES_FROM_LOCK_SCHEMA = vol.Schema(
+SET_VOLUME_ALL_SCHEMA = vol.Schema(
     {
-        vol.Optional("entity_id"): cv.entity_id,
+        vol.Required(ATTR_VOLUME): vol.In(list(VOLUME_OPTIONS)),
     }
 )
 
-CHECK_SYNC_STATUS_SCHEMA = vol.Schema(
-    {
-        vol.Optional("entity_id"): cv.entity_id,
-        vol.Required(ATTR_SLOT): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_USER_SLOTS)),
-    }
-)
 
-SET_USER_STATUS_SCHEMA = vol.Schema(
-    {
-        vol.Optional("entity_id"): cv.entity_id,
-        vol.Required(ATTR_SLOT): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_USER_SLOTS)),
-        vol.Required(ATTR_STATUS): vol.In([USER_STATUS_AVAILABLE, USER_STATUS_ENABLED, USER_STATUS_DISABLED]),
-    }
-)
-
-ENABLE_USER_SCHEMA = vol.Schema(
-    {
-        vol.Optional("entity_id"): cv.entity_id,
-        vol.Required(ATTR_SLOT): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_USER_SLOTS)),
-    }
-)
+def _as_aware(value: datetime | None, tz: tzinfo | None) -> datetime | None:
+    """Return value with tz attached if it is naive (for comparisons only)."""
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=tz)
 
-DISABLE_USER_SCHEMA = vol.Schema(
-    {
-        vol.Optional("entity_id"): cv.entity_id,
-        vol.Required(ATTR_SLOT): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_USER_SLOTS)),
-    }
-)
 
-RESET_USAGE_COUNT_SCHEMA = vol.Schema(
-    {
-        vol.Optional("entity_id"): cv.entity_id,
-        vol.Required(ATTR_SLOT): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_USER_SLOTS)),
-    }
-)
+# Services that map straight onto a coordinator method:
+# service -> (coordinator method, call.data keys passed positionally, action for log/error text, schema)
+_DIRECT_SERVICES: Final[dict[str, tuple[str, tuple[str, ...], str, vol.Schema]]] = {
+    SERVICE_SET_USAGE_LIMIT: ("async_set_usage_limit", (ATTR_SLOT, ATTR_MAX_USES), "set usage limit", SET_USAGE_LIMIT_SCHEMA),
+    SERVICE_PUSH_CODE_TO_LOCK: ("async_push_code_to_lock", (ATTR_SLOT,), "push code to lock", SLOT_ONLY_SCHEMA),
+    SERVICE_PULL_CODES_FROM_LOCK: ("async_pull_codes_from_lock", (), "pull codes from lock", ENTITY_ONLY_SCHEMA),
+    SERVICE_CHECK_SYNC_STATUS: ("async_check_sync_status", (ATTR_SLOT,), "check sync status", SLOT_ONLY_SCHEMA),
+    SERVICE_SET_USER_STATUS: ("async_set_user_status", (ATTR_SLOT, ATTR_STATUS), "set user status", SET_USER_STATUS_SCHEMA),
+    SERVICE_ENABLE_USER: ("async_enable_user", (ATTR_SLOT,), "enable user", SLOT_ONLY_SCHEMA),
+    SERVICE_DISABLE_USER: ("async_disable_user", (ATTR_SLOT,), "disable user", SLOT_ONLY_SCHEMA),
+    SERVICE_RESET_USAGE_COUNT: ("async_reset_usage_count", (ATTR_SLOT,), "reset usage count", SLOT_ONLY_SCHEMA),
+    SERVICE_CLEAR_LOCAL_CACHE: ("async_clear_local_cache", (), "clear local cache", ENTITY_ONLY_SCHEMA),
+    SERVICE_SEND_TEST_NOTIFICATION: ("async_send_test_notification", (ATTR_SLOT,), "send test notification", SLOT_ONLY_SCHEMA),
+}
 
 
 async def async_setup_services(hass: HomeAssistant) -> None:
-    """Set up services for Yale Lock Manager."""
+    """Set up services for Yale Lock Manager.
 
-    def get_coordinator() -> YaleLockCoordinator:
-        """Get the coordinator (assuming single instance for now)."""
-        if not hass.data.get(DOMAIN):
+    Called from every config entry's setup; services are domain-wide, so
+    they are only built and registered the first time.
+    """
+    if hass.services.has_service(DOMAIN, SERVICE_SET_USER_CODE):
+        return
+
+    def get_coordinator(call: ServiceCall) -> YaleLockCoordinator:
+        """Get the coordinator for the call's lock entity.
+
+        The card always passes its lock entity; calls without one (or with an
+        entity this integration does not own) fall back to the first lock.
+        """
+        if DOMAIN not in hass.data:
             raise HomeAssistantError("Yale Lock Manager integration not set up")
 
-        # Get first coordinator
-        coordinators = list(hass.data[DOMAIN].values())
-        if not coordinators:
+        coordinator = async_get_coordinator(hass, call.data.get(ATTR_ENTITY_ID))
+        if coordinator is None:
             raise HomeAssistantError("No Yale Lock Manager instances found")
 
-        return coordinators[0]
+        return coordinator
 
     async def handle_set_user_code(call: ServiceCall) -> None:
         """Handle set user code service call."""
-        coordinator = get_coordinator()
+        coordinator = get_coordinator(call)
         slot = call.data[ATTR_SLOT]
         code = call.data[ATTR_CODE]
         name = call.data[ATTR_NAME]
@@ -192,7 +211,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         
         Manual clears (from UI) should clear all local cached details.
         """
-        coordinator = get_coordinator()
+        coordinator = get_coordinator(call)
         slot = call.data[ATTR_SLOT]
 
         try:
@@ -205,20 +224,20 @@ async def async_setup_services(hass: HomeAssistant) -> None:
 
     async def handle_set_user_schedule(call: ServiceCall) -> None:
         """Handle set user schedule service call."""
-        from datetime import datetime
-        
-        coordinator = get_coordinator()
+        coordinator = get_coordinator(call)
         slot = call.data[ATTR_SLOT]
         start_datetime = call.data.get(ATTR_START_DATETIME)
         end_datetime = call.data.get(ATTR_END_DATETIME)
 
-        # Validate dates
-        now = datetime.now()
-        if start_datetime and start_datetime < now:
+        # Validate dates; naive values are in HA's time zone, as in the schedule check
+        now = dt_util.now()
+        start_cmp = _as_aware(start_datetime, now.tzinfo)
+        end_cmp = _as_aware(end_datetime, now.tzinfo)
+        if start_cmp and start_cmp < now:
             raise HomeAssistantError("Start date/time must be in the future")
-        if end_datetime and end_datetime < now:
+        if end_cmp and end_cmp < now:
             raise HomeAssistantError("End date/time must be in the future")
-        if start_datetime and end_datetime and end_datetime <= start_datetime:
+        if start_cmp and end_cmp and end_cmp <= start_cmp:
             raise HomeAssistantError("End date/time must be after start date/time")
 
         # Convert datetime objects to ISO strings
@@ -232,117 +251,9 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             _LOGGER.error("Error setting schedule: %s", err)
             raise HomeAssistantError(f"Failed to set schedule: {err}") from err
 
-    async def handle_set_usage_limit(call: ServiceCall) -> None:
-        """Handle set usage limit service call."""
-        coordinator = get_coordinator()
-        slot = call.data[ATTR_SLOT]
-        max_uses = call.data.get(ATTR_MAX_USES)
-
-        try:
-            await coordinator.async_set_usage_limit(slot, max_uses)
-            _LOGGER.info("Set usage limit for slot %s: %s", slot, max_uses)
-        except Exception as err:
-            _LOGGER.error("Error setting usage limit: %s", err)
-            raise HomeAssistantError(f"Failed to set usage limit: {err}") from err
-
-    async def handle_push_code_to_lock(call: ServiceCall) -> None:
-        """Handle push code to lock service call."""
-        coordinator = get_coordinator()
-        slot = call.data[ATTR_SLOT]
-
-        try:
-            await coordinator.async_push_code_to_lock(slot)
-            _LOGGER.info("Pushed code for slot %s to lock", slot)
-        except Exception as err:
-            _LOGGER.error("Error pushing code to lock: %s", err)
-            raise HomeAssistantError(f"Failed to push code to lock: {err}") from err
-
-    async def handle_pull_codes_from_lock(call: ServiceCall) -> None:
-        """Handle pull codes from lock service call."""
-        coordinator = get_coordinator()
-
-        try:
-            await coordinator.async_pull_codes_from_lock()
-            _LOGGER.info("Pulled codes from lock")
-        except Exception as err:
-            _LOGGER.error("Error pulling codes from lock: %s", err)
-            raise HomeAssistantError(f"Failed to pull codes from lock: {err}") from err
-
-    async def handle_check_sync_status(call: ServiceCall) -> None:
-        """Handle check sync status service call."""
-        coordinator = get_coordinator()
-        slot = call.data[ATTR_SLOT]
-
-        try:
-            await coordinator.async_check_sync_status(slot)
-            _LOGGER.info("Checked sync status for slot %s", slot)
-        except Exception as err:
-            _LOGGER.error("Error checking sync status: %s", err)
-            raise HomeAssistantError(f"Failed to check sync status: {err}") from err
-
-    async def handle_set_user_status(call: ServiceCall) -> None:
-        """Handle set user status service call."""
-        coordinator = get_coordinator()
-        slot = call.data[ATTR_SLOT]
-        status = call.data[ATTR_STATUS]
-
-        try:
-            await coordinator.async_set_user_status(slot, status)
-            _LOGGER.info("Set status for slot %s: %s", slot, status)
-        except Exception as err:
-            _LOGGER.error("Error setting user status: %s", err)
-            raise HomeAssistantError(f"Failed to set user status: {err}") from err
-
-    async def handle_enable_user(call: ServiceCall) -> None:
-        """Handle enable user service call."""
-        coordinator = get_coordinator()
-        slot = call.data[ATTR_SLOT]
-
-        try:
-            await coordinator.async_enable_user(slot)
-            _LOGGER.info("Enabled user for slot %s", slot)
-        except Exception as err:
-            _LOGGER.error("Error enabling user: %s", err)
-            raise HomeAssistantError(f"Failed to enable user: {err}") from err
-
-    async def handle_disable_user(call: ServiceCall) -> None:
-        """Handle disable user service call."""
-        coordinator = get_coordinator()
-        slot = call.data[ATTR_SLOT]
-
-        try:
-            await coordinator.async_disable_user(slot)
-            _LOGGER.info("Disabled user for slot %s", slot)
-        except Exception as err:
-            _LOGGER.error("Error disabling user: %s", err)
-            raise HomeAssistantError(f"Failed to disable user: {err}") from err
-
-    async def handle_reset_usage_count(call: ServiceCall) -> None:
-        """Handle reset usage count service call."""
-        coordinator = get_coordinator()
-        slot = call.data[ATTR_SLOT]
-
-        try:
-            await coordinator.async_reset_usage_count(slot)
-            _LOGGER.info("Reset usage count for slot %s", slot)
-        except Exception as err:
-            _LOGGER.error("Error resetting usage count: %s", err)
-            raise HomeAssistantError(f"Failed to reset usage count: {err}") from err
-
-    async def handle_clear_local_cache(call: ServiceCall) -> None:
-        """Handle clear local cache service call."""
-        coordinator = get_coordinator()
-
-        try:
-            await coordinator.async_clear_local_cache()
-            _LOGGER.info("Cleared local cache")
-        except Exception as err:
-            _LOGGER.error("Error clearing local cache: %s", err)
-            raise HomeAssistantError(f"Failed to clear local cache: {err}") from err
-
     async def handle_set_notification_enabled(call: ServiceCall) -> None:
         """Handle set notification enabled service call."""
-        coordinator = get_coordinator()
+        coordinator = get_coordinator(call)
         slot = call.data[ATTR_SLOT]
         enabled = call.data[ATTR_ENABLED]
         
@@ -360,20 +271,9 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             _LOGGER.error("Error setting notification enabled: %s", err)
             raise HomeAssistantError(f"Failed to set notification enabled: {err}") from err
 
-    async def handle_send_test_notification(call: ServiceCall) -> None:
-        """Handle send test notification service call."""
-        coordinator = get_coordinator()
-        slot = call.data[ATTR_SLOT]
-        try:
-            await coordinator.async_send_test_notification(slot)
-            _LOGGER.info("Test notification sent for slot %s", slot)
-        except Exception as err:
-            _LOGGER.error("Error sending test notification: %s", err)
-            raise HomeAssistantError(f"Failed to send test notification: {err}") from err
-
     async def handle_import_user_data(call: ServiceCall) -> None:
         """Handle import user data service call (restore from backup)."""
-        coordinator = get_coordinator()
+        coordinator = get_coordinator(call)
         data = call.data.get("data")
         if data is None:
             raise HomeAssistantError("Import data is required")
@@ -386,7 +286,46 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             _LOGGER.error("Error importing user data: %s", err)
             raise HomeAssistantError(f"Failed to import user data: {err}") from err
 
+    async def handle_set_volume_all(call: ServiceCall) -> None:
+        """Handle set volume on all locks service call.
+
+        Writes go to every lock concurrently rather than one lock at a time.
+        """
+        coordinators = list(hass.data.get(DOMAIN, {}).values())
+        if not coordinators:
+            raise HomeAssistantError("No Yale Lock Manager instances found")
+        option = call.data[ATTR_VOLUME]
+        value = VOLUME_OPTIONS[option]
+
+        results = await asyncio.gather(
+            *(coordinator.async_set_volume(value) for coordinator in coordinators),
+            return_exceptions=True,
+        )
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            _LOGGER.error("Error setting volume on %s of %s locks: %s", len(errors), len(coordinators), errors)
+            raise HomeAssistantError(
+                f"Failed to set volume on {len(errors)} of {len(coordinators)} locks: {errors[0]}"
+            )
+        _LOGGER.info("Set volume to %s on %s locks", option, len(coordinators))
+
+    async def handle_direct_service(call: ServiceCall) -> None:
+        """Handle a service call that maps straight onto a coordinator method."""
+        method, keys, action, _schema = _DIRECT_SERVICES[call.service]
+        coordinator = get_coordinator(call)
+        args = [call.data.get(key) for key in keys]
+
+        try:
+            await getattr(coordinator, method)(*args)
+            _LOGGER.info("Service %s completed %s", call.service, dict(zip(keys, args)))
+        except Exception as err:
+            _LOGGER.error("Error in %s: %s", call.service, err)
+            raise HomeAssistantError(f"Failed to {action}: {err}") from err
+
     # Register services
+    for service, (_method, _keys, _action, schema) in _DIRECT_SERVICES.items():
+        hass.services.async_register(DOMAIN, service, handle_direct_service, schema=schema)
+
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_USER_CODE,
@@ -398,7 +337,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         DOMAIN,
         SERVICE_CLEAR_USER_CODE,
         handle_clear_user_code,
-        schema=CLEAR_USER_CODE_SCHEMA,
+        schema=SLOT_ONLY_SCHEMA,
     )
 
     hass.services.async_register(
@@ -408,69 +347,6 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         schema=SET_USER_SCHEDULE_SCHEMA,
     )
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SET_USAGE_LIMIT,
-        handle_set_usage_limit,
-        schema=SET_USAGE_LIMIT_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_PUSH_CODE_TO_LOCK,
-        handle_push_code_to_lock,
-        schema=PUSH_CODE_TO_LOCK_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_PULL_CODES_FROM_LOCK,
-        handle_pull_codes_from_lock,
-        schema=PULL_CODES_FROM_LOCK_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_CHECK_SYNC_STATUS,
-        handle_check_sync_status,
-        schema=CHECK_SYNC_STATUS_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SET_USER_STATUS,
-        handle_set_user_status,
-        schema=SET_USER_STATUS_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_ENABLE_USER,
-        handle_enable_user,
-        schema=ENABLE_USER_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_DISABLE_USER,
-        handle_disable_user,
-        schema=DISABLE_USER_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_RESET_USAGE_COUNT,
-        handle_reset_usage_count,
-        schema=RESET_USAGE_COUNT_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_CLEAR_LOCAL_CACHE,
-        handle_clear_local_cache,
-        schema=vol.Schema({vol.Optional("entity_id"): cv.entity_id}),
-    )
-
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_NOTIFICATION_ENABLED,
@@ -480,19 +356,16 @@ async def async_setup_services(hass: HomeAssistant) -> None:
 
     hass.services.async_register(
         DOMAIN,
-        SERVICE_SEND_TEST_NOTIFICATION,
-        handle_send_test_notification,
-        schema=SEND_TEST_NOTIFICATION_SCHEMA,
+        SERVICE_IMPORT_USER_DATA,
+        handle_import_user_data,
+        schema=IMPORT_USER_DATA_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
-        SERVICE_IMPORT_USER_DATA,
-        handle_import_user_data,
-        schema=vol.Schema({
-            vol.Optional("entity_id"): cv.entity_id,
-            vol.Required("data"): dict,
-        }),
+        SERVICE_SET_VOLUME_ALL,
+        handle_set_volume_all,
+        schema=SET_VOLUME_ALL_SCHEMA,
     )
 
     _LOGGER.debug("Registered Yale Lock Manager services")
@@ -1,20 +1,32 @@
 """User data storage management for Yale Lock Manager."""
 from __future__ import annotations
 
-import copy
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.storage import Store
 
-from .const import STORAGE_KEY, STORAGE_VERSION, VERSION
+from .const import STORAGE_KEY, STORAGE_SAVE_DELAY, STORAGE_VERSION, VERSION
 from .logger import YaleLockLogger
 
 _LOGGER = YaleLockLogger()
 
 
+def _users_from_json(users: dict[str, Any]) -> dict[int, Any]:
+    """Return users keyed by int slot (JSON object keys are always strings)."""
+    return {int(slot): user for slot, user in users.items()}
+
+
 class UserDataStorage:
-    """Manages user data persistence."""
+    """Manages user data persistence.
+
+    In memory, users are keyed by int slot; keys are only converted to
+    strings when the data is written to disk or exported.
+    """
+
+    __slots__ = ("_hass", "_store", "_user_data", "_logger", "_save_pending")
 
     def __init__(self, hass: HomeAssistant, node_id: int) -> None:
         """Initialize storage."""
@@ -26,57 +38,95 @@ class UserDataStorage:
             "users": {},
         }
         self._logger = YaleLockLogger("yale_lock_manager.storage")
+        self._save_pending = False
 
     async def load(self) -> None:
         """Load user data from storage."""
         data = await self._store.async_load()
         if data:
+            data["users"] = _users_from_json(data.get("users") or {})
             self._user_data = data
             self._logger.debug("Loaded user data from storage", force=True)
         else:
             self._logger.debug("No existing user data found", force=True)
 
     async def save(self) -> None:
-        """Save user data to storage."""
-        await self._store.async_save(self._user_data)
+        """Schedule a save of user data to storage.
+
+        The write is delayed by STORAGE_SAVE_DELAY so consecutive changes are
+        serialised and written once; Store also flushes pending writes on
+        Home Assistant shutdown. Call flush() to write immediately.
+        """
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data for a delayed write."""
+        self._save_pending = False
         self._logger.debug("Saved user data to storage", force=True)
-
-    async def clear(self) -> None:
-        """Clear all user data."""
+        return self.as_json()
+
+    async def flush(self) -> None:
+        """Write a pending delayed save now (e.g. on unload)."""
+        if self._save_pending:
+            self._save_pending = False
+            await self._store.async_save(self.as_json())
+            self._logger.debug("Flushed user data to storage", force=True)
+
+    async def clear(self) -> bool:
+        """Clear all user data; return False (and skip the save) if already empty."""
+        if not self._user_data["users"]:
+            self._logger.info("Local cache already empty - nothing to clear")
+            return False
         self._logger.info("Clearing all local user data cache")
         self._user_data["users"] = {}
         await self.save()
         self._logger.info("Local cache cleared - all user data removed")
+        return True
 
     def get_user(self, slot: int) -> dict[str, Any] | None:
         """Get user data for a specific slot."""
-        return self._user_data["users"].get(str(slot))
+        return self._user_data["users"].get(slot)
+
+    def get_all_users(self) -> Mapping[int, Any]:
+        """Get all users keyed by slot.
 
-    def get_all_users(self) -> dict[str, Any]:
-        """Get all users."""
-        return self._user_data["users"]
+        A read-only live view, not a copy; changes go through update_user,
+        add_user and remove_user.
+        """
+        return MappingProxyType(self._user_data["users"])
 
     def update_user(self, slot: int, data: dict[str, Any]) -> None:
         """Update user data for a slot."""
-        slot_str = str(slot)
-        if slot_str in self._user_data["users"]:
-            self._user_data["users"][slot_str].update(data)
+        if slot in self._user_data["users"]:
+            self._user_data["users"][slot].update(data)
         else:
-            self._user_data["users"][slot_str] = data
+            self._user_data["users"][slot] = data
 
     def add_user(self, slot: int, data: dict[str, Any]) -> None:
         """Add a new user."""
-        self._user_data["users"][str(slot)] = data
+        self._user_data["users"][slot] = data
 
-    def remove_user(self, slot: int) -> None:
-        """Remove a user."""
-        slot_str = str(slot)
-        if slot_str in self._user_data["users"]:
-            del self._user_data["users"][slot_str]
+    def remove_user(self, slot: int) -> bool:
+        """Remove a user; return False if the slot had no user (nothing to save)."""
+        return self._user_data["users"].pop(slot, None) is not None
 
     def replace_users(self, users: dict[str, Any]) -> None:
-        """Replace all users with a deep copy of the given users dict (for import/restore)."""
-        self._user_data["users"] = copy.deepcopy(users)
+        """Replace all users (for import/restore).
+
+        Takes string-keyed users as found in an export; the user dicts are
+        kept as-is, so callers must pass freshly built data that nothing else
+        references.
+        """
+        self._user_data["users"] = _users_from_json(users)
+
+    def as_json(self) -> dict[str, Any]:
+        """Return the storage payload with string slot keys (as written to disk)."""
+        return {
+            **self._user_data,
+            "users": {str(slot): user for slot, user in self._user_data["users"].items()},
+        }
 
     @property
     def data(self) -> dict[str, Any]:
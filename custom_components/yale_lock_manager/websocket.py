@@ -1,15 +1,43 @@
 """WebSocket API for Yale Lock Manager."""
 from __future__ import annotations
 
+from typing import Any
+
+import voluptuous as vol
+
 from homeassistant.components import websocket_api
+from homeassistant.components.websocket_api.messages import construct_result_message
+from homeassistant.const import ATTR_ENTITY_ID
 from homeassistant.core import HomeAssistant
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.json import json_bytes
 
 from .const import DOMAIN
+from .coordinator import YaleLockCoordinator, async_get_coordinator
+
+# Optional lock selection shared by the commands: a config entry, or the
+# manager lock entity the card is configured with
+_TARGET_SCHEMA = {
+    vol.Exclusive("entry_id", "target"): str,
+    vol.Exclusive(ATTR_ENTITY_ID, "target"): cv.entity_id,
+}
+
+
+def _get_coordinator(hass: HomeAssistant, msg: dict[str, Any]) -> YaleLockCoordinator | None:
+    """Return the coordinator for the message's entry_id, else as the services resolve it.
+
+    An unknown entry_id gives None; an entity_id that is missing or not ours
+    falls back to the first lock, like the services.
+    """
+    if (entry_id := msg.get("entry_id")) is not None:
+        return (hass.data.get(DOMAIN) or {}).get(entry_id)
+    return async_get_coordinator(hass, msg.get(ATTR_ENTITY_ID))
 
 
 @websocket_api.websocket_command(
     {
         "type": "yale_lock_manager/get_notification_services",
+        **_TARGET_SCHEMA,
     }
 )
 @websocket_api.callback
@@ -19,10 +47,9 @@ def ws_get_notification_services(
     msg: dict,
 ) -> None:
     """Return list of notify services (id, name, type) for the frontend."""
-    coordinators = hass.data.get(DOMAIN) or {}
-    coordinator = next(iter(coordinators.values()), None)
-    if not coordinator:
-        connection.send_result(msg["id"], {"services": []})
+    coordinator = _get_coordinator(hass, msg)
+    if coordinator is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Yale Lock Manager lock not found")
         return
     services = coordinator.get_notification_services_list()
     connection.send_result(msg["id"], {"services": services})
@@ -31,6 +58,7 @@ def ws_get_notification_services(
 @websocket_api.websocket_command(
     {
         "type": "yale_lock_manager/export_user_data",
+        **_TARGET_SCHEMA,
     }
 )
 @websocket_api.callback
@@ -39,11 +67,16 @@ def ws_export_user_data(
     connection: websocket_api.ActiveConnection,
     msg: dict,
 ) -> None:
-    """Return full user data (storage payload) for backup/export."""
-    coordinators = hass.data.get(DOMAIN) or {}
-    coordinator = next(iter(coordinators.values()), None)
-    if not coordinator:
-        connection.send_result(msg["id"], {"data": None})
+    """Return full user data (storage payload) for backup/export.
+
+    The live storage dict is serialised straight into the response bytes
+    (orjson writes the int slot keys as strings), without building a
+    string-keyed copy first.
+    """
+    coordinator = _get_coordinator(hass, msg)
+    if coordinator is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Yale Lock Manager lock not found")
         return
-    data = coordinator.user_data
-    connection.send_result(msg["id"], {"data": data})
+    connection.send_message(
+        construct_result_message(msg["id"], json_bytes({"data": coordinator.user_data}))
+    )
@@ -1881,7 +1881,10 @@ class YaleLockManagerPanel extends HTMLElement {
   async exportBackup() {
     try {
       this.showStatus(0, 'Exporting...', 'info');
-      const res = await this._hass.callWS({ type: 'yale_lock_manager/export_user_data' });
+      const res = await this._hass.callWS({
+        type: 'yale_lock_manager/export_user_data',
+        entity_id: this._config.entity,
+      });
       const data = res?.result?.data ?? res?.data;
       if (data == null) {
         this.showStatus(0, 'No data to export', 'error');
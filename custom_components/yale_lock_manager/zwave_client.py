@@ -2,18 +2,21 @@
 from __future__ import annotations
 
 import asyncio
-import json
-import logging
-import re
-from typing import Any
+from collections.abc import AsyncIterator, Callable, Iterable
+from typing import Any, Final
 
-from homeassistant.components.zwave_js import DOMAIN as ZWAVE_JS_DOMAIN
-from homeassistant.core import HomeAssistant
+from zwave_js_server.const import CommandClass
+
+from homeassistant.components.lock import DOMAIN as LOCK_DOMAIN
+from homeassistant.components.zwave_js.helpers import async_get_node_from_entity_id
+from homeassistant.core import Context, HomeAssistant, State, callback
 
 from .const import (
-    CC_USER_CODE,
     CODE_TYPE_FOB,
     CODE_TYPE_PIN,
+    USER_CODE_CACHE_TTL,
+    USER_CODE_QUERY_CONCURRENCY,
+    USER_CODE_QUERY_TIMEOUT,
     USER_STATUS_AVAILABLE,
     USER_STATUS_DISABLED,
     USER_STATUS_ENABLED,
@@ -22,6 +25,28 @@ from .logger import YaleLockLogger
 
 _LOGGER = YaleLockLogger()
 
+_UNAVAILABLE_STATES: Final = frozenset(("unknown", "unavailable"))
+
+
+def _parse_number(state: str) -> int:
+    """Parse a number entity state, e.g. "7" or "7.0" -> 7.
+
+    Integer strings (the common case) skip the float conversion.
+    """
+    if state.lstrip("-").isdigit():
+        return int(state)
+    return int(float(state))
+
+
+# Config parameters read from the Z-Wave JS entities: (data key / entity role,
+# default when unavailable or unparseable, state parser)
+_CONFIG_SPECS: Final[tuple[tuple[str, int, Callable[[str], int]], ...]] = (
+    ("volume", 2, _parse_number),  # Parameter 1; default Low
+    ("auto_relock", 255, lambda state: 255 if state == "Enable" else 0),  # Parameter 2; default Enable
+    ("manual_relock_time", 7, _parse_number),  # Parameter 3
+    ("remote_relock_time", 10, _parse_number),  # Parameter 6
+)
+
 
 class ZWaveClient:
     """Handles all Z-Wave JS API interactions."""
@@ -33,12 +58,59 @@ class ZWaveClient:
         self._lock_entity_id = lock_entity_id
         self._logger = YaleLockLogger("yale_lock_manager.zwave_client")
 
+        # Related Z-Wave entities, derived from the lock entity ID once.
+        # The Z-Wave JS lock may carry a "_2" suffix its sibling entities lack.
+        base_name = lock_entity_id.split(".", 1)[1]
+        zwave_base = base_name[:-2] if base_name.endswith("_2") else base_name
+        self._candidates: dict[str, tuple[str, ...]] = {
+            "battery": (
+                f"sensor.{zwave_base}_battery_level",
+                f"sensor.{zwave_base}_battery",
+                f"sensor.{base_name}_battery_level",
+                f"sensor.{base_name}_battery",
+            ),
+            "door": (
+                f"binary_sensor.{zwave_base}_current_status_of_the_door",
+                f"binary_sensor.{zwave_base}_door",
+                f"binary_sensor.{base_name}_door",
+            ),
+            "bolt": (
+                f"binary_sensor.{zwave_base}_bolt",
+                f"binary_sensor.{base_name}_bolt",
+            ),
+            "volume": (f"number.{zwave_base}_volume",),
+            "auto_relock": (f"select.{zwave_base}_auto_relock",),
+            "manual_relock_time": (f"number.{zwave_base}_manual_relock_time",),
+            "remote_relock_time": (f"number.{zwave_base}_remote_relock_time",),
+        }
+        # Role -> candidate entity that last answered
+        self._resolved: dict[str, str] = {}
+        # Slot -> (loop time, user code data) of the last successful query
+        self._slot_cache: dict[int, tuple[float, dict[str, Any]]] = {}
+
+    def invalidate_slot_cache(self, slot: int | None = None) -> None:
+        """Forget cached user code data for one slot, or for all slots."""
+        if slot is None:
+            self._slot_cache.clear()
+        else:
+            self._slot_cache.pop(slot, None)
+
     async def get_user_code_data(self, slot: int) -> dict[str, Any] | None:
-        """Get user code data (status and code) from the lock using invoke_cc_api.
-        
-        The response from invoke_cc_api is logged by Z-Wave JS but not stored in the node's cache.
-        We capture the response by temporarily intercepting log messages from Z-Wave JS.
+        """Get user code data (status and code) from the lock.
+
+        Invokes the User Code CC API on the Z-Wave JS node directly and waits
+        for its result, e.g. {"userIdStatus": 1, "userCode": "1234"}; the
+        zwave_js.invoke_cc_api service only logs the result, it does not
+        return it.
+
+        A successful answer is reused for USER_CODE_CACHE_TTL seconds, so
+        back-to-back checks of the same slot cost one Z-Wave round trip.
+        Writes to the slot drop it from the cache.
         """
+        cached = self._slot_cache.get(slot)
+        if cached is not None and self._hass.loop.time() - cached[0] < USER_CODE_CACHE_TTL:
+            return cached[1]
+
         # Validate entity exists and is available before attempting service call
         lock_state = self._hass.states.get(self._lock_entity_id)
         if not lock_state:
@@ -57,106 +129,60 @@ class ZWaveClient:
             )
             return None
         
-        captured_response: dict[str, Any] | None = None
-        log_capture_complete = asyncio.Event()
-        
-        # Set up a temporary log handler to capture the Z-Wave JS log message
-        class ResponseLogHandler(logging.Handler):
-            """Temporary log handler to capture invoke_cc_api response from Z-Wave JS logs."""
-            
-            def __init__(self, target_slot: int, event: asyncio.Event):
-                super().__init__()
-                self.target_slot = target_slot
-                self.event = event
-                self.captured_data: dict[str, Any] | None = None
-                
-            def emit(self, record):
-                """Capture log messages containing invoke_cc_api responses."""
-                if record.name != "homeassistant.components.zwave_js.services":
-                    return
-                
-                message = record.getMessage()
-                # Look for the log pattern: "Invoked USER_CODE CC API method get... with the following result: {...}"
-                if "Invoked USER_CODE CC API method get" in message and "with the following result:" in message:
-                    # Extract the result dictionary from the log message
-                    # Pattern: "... with the following result: {'userIdStatus': 1, 'userCode': '19992017'}"
-                    match = re.search(r"with the following result:\s*(\{.*?\})", message)
-                    if match:
-                        try:
-                            # Parse the dictionary string
-                            result_str = match.group(1)
-                            # Replace single quotes with double quotes for JSON parsing
-                            result_str = result_str.replace("'", '"')
-                            result_dict = json.loads(result_str)
-                            
-                            # Verify this is for our slot by checking if the data makes sense
-                            # (We can't verify slot from the log, but we'll capture the first response)
-                            if isinstance(result_dict, dict) and ("userIdStatus" in result_dict or "userCode" in result_dict):
-                                self.captured_data = result_dict
-                                self.event.set()
-                                _LOGGER.debug("Captured response from log", slot=self.target_slot, force=True)
-                        except (json.JSONDecodeError, AttributeError) as err:
-                            _LOGGER.debug("Could not parse response from log message", error=str(err), force=True)
-        
         try:
             self._logger.info_operation("Querying lock for user code data", slot)
-            
-            # Set up log handler BEFORE calling invoke_cc_api
-            log_handler = ResponseLogHandler(slot, log_capture_complete)
-            log_handler.setLevel(logging.INFO)
-            
-            # Get the Z-Wave JS services logger
-            zwave_js_logger = logging.getLogger("homeassistant.components.zwave_js.services")
-            zwave_js_logger.addHandler(log_handler)
-            
-            try:
-                # Call invoke_cc_api to trigger the lock to report its user code data
-                self._logger.debug("Calling invoke_cc_api", slot=slot, force=True)
-                await self._hass.services.async_call(
-                    ZWAVE_JS_DOMAIN,
-                    "invoke_cc_api",
-                    {
-                        "entity_id": self._lock_entity_id,
-                        "command_class": CC_USER_CODE,
-                        "method_name": "get",
-                        "parameters": [slot],
-                    },
-                    blocking=True,
-                )
-                
-                self._logger.debug("invoke_cc_api call completed, waiting for log message", force=True)
-                
-                # Wait for the log handler to capture the response (with timeout)
-                try:
-                    await asyncio.wait_for(log_capture_complete.wait(), timeout=3.0)
-                    captured_response = log_handler.captured_data
-                except asyncio.TimeoutError:
-                    self._logger.warning("Timeout waiting for invoke_cc_api response log", slot=slot)
-                
-            finally:
-                # Always remove the log handler
-                zwave_js_logger.removeHandler(log_handler)
-            
-            if captured_response:
-                self._logger.info_operation(
-                    "Captured response from log",
-                    slot,
-                    status=captured_response.get("userIdStatus"),
-                    code="***" if captured_response.get("userCode") else None,
-                )
-                return captured_response
-            else:
-                self._logger.warning(
-                    "Could not capture response from invoke_cc_api log. "
-                    "The call succeeded (see Z-Wave JS logs), but the response was not captured.",
-                    slot=slot,
-                )
-                return None
-                
+
+            node = async_get_node_from_entity_id(self._hass, self._lock_entity_id)
+            # Ask the node directly; the result comes back in the response
+            result = await asyncio.wait_for(
+                node.async_invoke_cc_api(
+                    CommandClass.USER_CODE, "get", slot, wait_for_result=True
+                ),
+                timeout=USER_CODE_QUERY_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            self._logger.warning("Timeout waiting for user code data from lock", slot=slot)
+            return None
         except Exception as err:
             self._logger.error_zwave("get_user_code_data", err, slot=slot)
             return None
 
+        if not isinstance(result, dict):
+            self._logger.warning("Unexpected user code response from lock", slot=slot, response=str(result))
+            return None
+
+        self._logger.info_operation(
+            "Received user code data",
+            slot,
+            status=result.get("userIdStatus"),
+            code="***" if result.get("userCode") else None,
+        )
+        self._slot_cache[slot] = (self._hass.loop.time(), result)
+        return result
+
+    async def iter_user_code_data(
+        self, slots: Iterable[int]
+    ) -> AsyncIterator[tuple[int, dict[str, Any] | None]]:
+        """Query many slots concurrently; yield (slot, data) in slot order.
+
+        At most USER_CODE_QUERY_CONCURRENCY queries are in flight at once so
+        the lock is not flooded. Queries still pending when the caller stops
+        iterating are cancelled.
+        """
+        semaphore = asyncio.Semaphore(USER_CODE_QUERY_CONCURRENCY)
+
+        async def query(slot: int) -> dict[str, Any] | None:
+            async with semaphore:
+                return await self.get_user_code_data(slot)
+
+        tasks = [(slot, asyncio.create_task(query(slot))) for slot in slots]
+        try:
+            for slot, task in tasks:
+                yield slot, await task
+        finally:
+            for _, task in tasks:
+                task.cancel()
+
     async def set_user_code(self, slot: int, code: str) -> None:
         """Set user code on the lock using zwave_js.set_lock_usercode service.
         
@@ -175,12 +201,11 @@ class ZWaveClient:
             if not usercode:
                 raise ValueError("Code cannot be empty. Use clear_user_code() to clear a code.")
             
-            _LOGGER.info(
-                "set_user_code called: slot=%s, code='%s'",
-                code_slot, usercode
-            )
+            # Debug only, and never the PIN itself; info_operation is the summary
+            _LOGGER.debug("set_user_code called: slot=%s", code_slot)
             
             self._logger.info_operation("Setting user code on lock", slot, code="***")
+            self.invalidate_slot_cache(code_slot)
             
             # Use Z-Wave JS service (lock_code_manager approach)
             await self._hass.services.async_call(
@@ -195,7 +220,7 @@ class ZWaveClient:
             )
             
             self._logger.info_operation("User code set on lock", slot)
-            _LOGGER.info("set_user_code completed: slot=%s", slot)
+            _LOGGER.debug("set_user_code completed: slot=%s", slot)
             
         except Exception as err:
             self._logger.error_zwave("set_user_code", err, slot=slot)
@@ -214,9 +239,10 @@ class ZWaveClient:
         try:
             code_slot = int(slot)
             
-            _LOGGER.info("clear_user_code called: slot=%s", code_slot)
+            _LOGGER.debug("clear_user_code called: slot=%s", code_slot)
             
             self._logger.info_operation("Clearing user code from lock", slot)
+            self.invalidate_slot_cache(code_slot)
             
             # Use Z-Wave JS service (lock_code_manager approach)
             await self._hass.services.async_call(
@@ -230,75 +256,78 @@ class ZWaveClient:
             )
             
             self._logger.info_operation("User code cleared from lock", slot)
-            _LOGGER.info("clear_user_code completed: slot=%s", slot)
+            _LOGGER.debug("clear_user_code completed: slot=%s", slot)
             
         except Exception as err:
             self._logger.error_zwave("clear_user_code", err, slot=slot)
             raise
 
-    async def get_lock_state(self) -> dict[str, Any]:
-        """Get lock state (door, bolt, battery) from Z-Wave entities."""
+    async def set_locked(self, locked: bool, context: Context | None = None) -> None:
+        """Lock or unlock the Z-Wave lock through the lock service.
+
+        context is the originating call's context, so the Z-Wave lock's
+        state change is attributed to the user who asked for it.
+        """
+        await self._hass.services.async_call(
+            LOCK_DOMAIN,
+            "lock" if locked else "unlock",
+            {"entity_id": self._lock_entity_id},
+            blocking=True,
+            context=context,
+        )
+
+    def _find_state(self, role: str) -> State | None:
+        """Return the first available state among the role's candidate entities.
+
+        The entity that answered is remembered and tried first next time.
+        """
+        states = self._hass.states
+        resolved = self._resolved.get(role)
+        if resolved is not None:
+            state = states.get(resolved)
+            if state is not None and state.state not in _UNAVAILABLE_STATES:
+                return state
+        for entity_id in self._candidates[role]:
+            state = states.get(entity_id)
+            if state is not None and state.state not in _UNAVAILABLE_STATES:
+                self._resolved[role] = entity_id
+                return state
+        return None
+
+    @callback
+    def get_lock_state(self) -> dict[str, Any]:
+        """Get lock state (door, bolt, battery) from Z-Wave entities.
+
+        Reads the state machine only, so it runs synchronously in the loop.
+        """
         data: dict[str, Any] = {}
         
         # Get lock state
         lock_state = self._hass.states.get(self._lock_entity_id)
         if lock_state:
             data["lock_state"] = lock_state.state
-            data["lock_attributes"] = dict(lock_state.attributes)
             
             # Try to get door/bolt/battery from lock attributes first
-            data["door_status"] = lock_state.attributes.get("door_status")
-            data["bolt_status"] = lock_state.attributes.get("bolt_status")
-            data["battery_level"] = lock_state.attributes.get("battery_level")
-
-        # If not in attributes, search for related Z-Wave entities
-        base_name = self._lock_entity_id.split('.')[1]
-        if base_name.endswith('_2'):
-            zwave_base = base_name[:-2]  # Remove _2 suffix
-        else:
-            zwave_base = base_name
-        
-        # Find battery sensor
-        battery_entities = [
-            f"sensor.{zwave_base}_battery_level",
-            f"sensor.{zwave_base}_battery",
-            f"sensor.{base_name}_battery_level",
-            f"sensor.{base_name}_battery",
-        ]
-        
-        for battery_entity in battery_entities:
-            battery_state = self._hass.states.get(battery_entity)
-            if battery_state and battery_state.state not in ("unknown", "unavailable"):
-                try:
-                    data["battery_level"] = int(float(battery_state.state))
-                    break
-                except (ValueError, TypeError):
-                    pass
-
-        # Find door binary sensor
-        door_entities = [
-            f"binary_sensor.{zwave_base}_current_status_of_the_door",
-            f"binary_sensor.{zwave_base}_door",
-            f"binary_sensor.{base_name}_door",
-        ]
-        
-        for door_entity in door_entities:
-            door_state = self._hass.states.get(door_entity)
-            if door_state and door_state.state not in ("unknown", "unavailable"):
-                data["door_status"] = "open" if door_state.state == "on" else "closed"
-                break
-
-        # Find bolt binary sensor
-        bolt_entities = [
-            f"binary_sensor.{zwave_base}_bolt",
-            f"binary_sensor.{base_name}_bolt",
-        ]
-        
-        for bolt_entity in bolt_entities:
-            bolt_state = self._hass.states.get(bolt_entity)
-            if bolt_state and bolt_state.state not in ("unknown", "unavailable"):
-                data["bolt_status"] = "locked" if bolt_state.state == "on" else "unlocked"
-                break
+            attributes = lock_state.attributes
+            data["door_status"] = attributes.get("door_status")
+            data["bolt_status"] = attributes.get("bolt_status")
+            data["battery_level"] = attributes.get("battery_level")
+
+        # If not in attributes, use the related Z-Wave entities
+        battery_state = self._find_state("battery")
+        if battery_state:
+            try:
+                data["battery_level"] = _parse_number(battery_state.state)
+            except (ValueError, TypeError):
+                pass
+
+        door_state = self._find_state("door")
+        if door_state:
+            data["door_status"] = "open" if door_state.state == "on" else "closed"
+
+        bolt_state = self._find_state("bolt")
+        if bolt_state:
+            data["bolt_status"] = "locked" if bolt_state.state == "on" else "unlocked"
                 
         # If bolt is still not found, use lock state as fallback
         if "bolt_status" not in data or data["bolt_status"] is None:
@@ -307,64 +336,17 @@ class ZWaveClient:
 
         return data
 
-    async def get_config_parameters(self) -> dict[str, Any]:
-        """Get lock configuration parameters."""
-        data: dict[str, Any] = {}
-        
-        base_name = self._lock_entity_id.split('.')[1]
-        if base_name.endswith('_2'):
-            zwave_base = base_name[:-2]
-        else:
-            zwave_base = base_name
-        
-        try:
-            # Volume (parameter 1)
-            volume_entity = f"number.{zwave_base}_volume"
-            volume_state = self._hass.states.get(volume_entity)
-            if volume_state and volume_state.state not in ("unknown", "unavailable"):
-                try:
-                    data["volume"] = int(float(volume_state.state))
-                except (ValueError, TypeError):
-                    data["volume"] = 2  # Default: Low
-            else:
-                data["volume"] = 2  # Default: Low
-            
-            # Auto Relock (parameter 2)
-            auto_relock_entity = f"select.{zwave_base}_auto_relock"
-            auto_relock_state = self._hass.states.get(auto_relock_entity)
-            if auto_relock_state and auto_relock_state.state not in ("unknown", "unavailable"):
-                data["auto_relock"] = 255 if auto_relock_state.state == "Enable" else 0
-            else:
-                data["auto_relock"] = 255  # Default: Enable
-            
-            # Manual Relock Time (parameter 3)
-            manual_entity = f"number.{zwave_base}_manual_relock_time"
-            manual_state = self._hass.states.get(manual_entity)
-            if manual_state and manual_state.state not in ("unknown", "unavailable"):
-                try:
-                    data["manual_relock_time"] = int(float(manual_state.state))
-                except (ValueError, TypeError):
-                    data["manual_relock_time"] = 7  # Default
-            else:
-                data["manual_relock_time"] = 7  # Default
-            
-            # Remote Relock Time (parameter 6)
-            remote_entity = f"number.{zwave_base}_remote_relock_time"
-            remote_state = self._hass.states.get(remote_entity)
-            if remote_state and remote_state.state not in ("unknown", "unavailable"):
-                try:
-                    data["remote_relock_time"] = int(float(remote_state.state))
-                except (ValueError, TypeError):
-                    data["remote_relock_time"] = 10  # Default
-            else:
-                data["remote_relock_time"] = 10  # Default
-                
-        except Exception as err:
-            self._logger.warning("Could not fetch config parameters", error=str(err))
-            # Set defaults
-            data["volume"] = 2
-            data["auto_relock"] = 255
-            data["manual_relock_time"] = 7
-            data["remote_relock_time"] = 10
+    @callback
+    def get_config_parameters(self) -> dict[str, Any]:
+        """Get lock configuration parameters (volume, auto relock, relock times).
 
+        Reads the state machine only, so it runs synchronously in the loop.
+        """
+        data: dict[str, Any] = {}
+        for key, default, parse in _CONFIG_SPECS:
+            state = self._find_state(key)
+            try:
+                data[key] = parse(state.state) if state else default
+            except (ValueError, TypeError):
+                data[key] = default
         return data